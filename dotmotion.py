@@ -17,17 +17,28 @@ Usage:
     self.play(relay.connect_parachain(para1))
 """
 
+from __future__ import annotations
+
 from manim import (VGroup, Circle, Text, Dot, Annulus, Polygon, Line,
                    RoundedRectangle, Arrow, DOWN, UP, LEFT, RIGHT, ORIGIN, TAU,
                    WHITE, Create, FadeIn, FadeOut, GrowFromCenter, Write,
                    BackgroundRectangle, BLACK, SVGMobject, ImageMobject, config,
-                   VMobject, MoveAlongPath)
+                   VMobject, MoveAlongPath, MathTex)
 import numpy as np
-from typing import List, Tuple
-import random
+from typing import TYPE_CHECKING
+import math
 from pathlib import Path
+import io
 import os
+import re
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+
+if TYPE_CHECKING:
+    # Annotations are not evaluated at runtime, so typing stays off the import path
+    from typing import List, Tuple
 
 try:
     # Available on all modern Manim installs; allows registering local fonts
@@ -35,6 +46,22 @@ try:
 except Exception:
     _register_font = None
 
+try:
+    # Optional: compiles the small numeric kernels below to native code
+    from numba import njit as _njit
+except Exception:
+    def _njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    # Optional: faster JSON parsing for the chain registry
+    from orjson import loads as _json_loads
+except Exception:
+    from json import loads as _json_loads
+
 # ===== POLKADOT THEME CONSTANTS =====
 
 # Official Polkadot palette from brand hub
@@ -67,9 +94,11 @@ COMPLEX_CREATE = 2.0
 
 
 _FONT_STATE = {
-    "preferred": "Unbounded",
-    "fallbacks": ["Helvetica Neue", "Helvetica", "Arial"],
+    # Preferred font followed by its fallbacks, replaced as a whole by set_brand_font
+    "chain": ("Unbounded", "Helvetica Neue", "Helvetica", "Arial"),
     "registered": False,
+    # Font name that rendered successfully; "" means Manim's default font
+    "resolved": None,
 }
 
 
@@ -78,46 +107,71 @@ def register_unbounded_fonts(fonts_dir: str = None) -> None:
 
     This uses manimpango.register_font to make the `.ttf` files available to
     Pango. If registration is not available, this function is a no-op.
+    The bundled fonts are registered once at import; pass fonts_dir to add more.
     """
-    if _FONT_STATE["registered"]:
+    if _FONT_STATE["registered"] and fonts_dir is None:
         return
     if _register_font is None:
         return
 
-    base_dir = Path(__file__).resolve().parent
-    fonts_path = Path(fonts_dir) if fonts_dir else base_dir / "fonts" / "unbounded"
-    if fonts_path.exists():
-        for ttf in fonts_path.glob("*.ttf"):
-            try:
-                _register_font(str(ttf))
-            except Exception:
-                # Ignore per-file registration issues, try others
-                pass
+    fonts_path = fonts_dir or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "fonts", "unbounded")
+    try:
+        with os.scandir(fonts_path) as entries:
+            ttf_paths = [e.path for e in entries if e.name.endswith(".ttf")]
+    except OSError:
+        return
+    if fonts_dir is None:
+        # Flip the flag before registering so re-entrant calls return early
         _FONT_STATE["registered"] = True
+    for ttf in ttf_paths:
+        try:
+            _register_font(ttf)
+        except Exception:
+            # Ignore per-file registration issues, try others
+            pass
 
 
 def set_brand_font(preferred: str = "Unbounded", fallbacks: List[str] = None) -> None:
     """Set the preferred brand font and fallback list used by create_text."""
-    _FONT_STATE["preferred"] = preferred
-    if fallbacks:
-        _FONT_STATE["fallbacks"] = list(fallbacks)
+    if not fallbacks:
+        fallbacks = _FONT_STATE["chain"][1:]
+    _FONT_STATE["chain"] = (preferred, *fallbacks)
+    # Re-probe the chain on next text creation; cached glyphs used the old font
+    _FONT_STATE["resolved"] = None
+    _TEXT_CACHE.clear()
 
 
 def _create_text_with_font_chain(text: str, font_size: float, color) -> Text:
-    font_candidates = [_FONT_STATE["preferred"], *_FONT_STATE["fallbacks"]]
+    # Fast path: reuse the font resolved by an earlier probe
+    resolved = _FONT_STATE["resolved"]
+    if resolved:
+        return Text(text, font=resolved, font_size=font_size, color=color, weight="BOLD")
+    if resolved == "":
+        return Text(text, font_size=font_size, color=color, weight="BOLD")
+
     last_error = None
-    for font_name in font_candidates:
+    for font_name in _FONT_STATE["chain"]:
         try:
-            return Text(text, font=font_name, font_size=font_size, color=color, weight="BOLD")
+            text_obj = Text(text, font=font_name, font_size=font_size, color=color, weight="BOLD")
         except Exception as exc:
             last_error = exc
             continue
+        _FONT_STATE["resolved"] = font_name
+        return text_obj
     # As a last resort, let Manim pick a default font
     try:
-        return Text(text, font_size=font_size, color=color, weight="BOLD")
+        text_obj = Text(text, font_size=font_size, color=color, weight="BOLD")
     except Exception:
         # If absolutely everything fails, re-raise last error for visibility
         raise last_error
+    _FONT_STATE["resolved"] = ""
+    return text_obj
+
+
+# Shaped Text templates keyed by (text, font_size, color); callers get copies
+_TEXT_CACHE = {}
+_TEXT_CACHE_MAX = 512
 
 
 def create_text(text, font_size=24, color=WHITE):
@@ -125,10 +179,75 @@ def create_text(text, font_size=24, color=WHITE):
 
     - Tries to register bundled Unbounded fonts at runtime
     - Falls back gracefully to Helvetica Neue, Helvetica, then Arial
+    - Repeated labels are copied from a cached template instead of re-shaped
+    """
+    return _text_template(text, font_size, color).copy()
+
+
+def _text_template(text, font_size, color) -> Text:
+    """Cached shaped Text for (text, font_size, color), shaping and storing it on a miss."""
+    key = (text, font_size, str(color))
+    template = _TEXT_CACHE.get(key)
+    if template is None:
+        template = _create_text_with_font_chain(text=text, font_size=font_size, color=color)
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+        _TEXT_CACHE[key] = template
+    return template
+
+
+# Fixed labels used by the built-in components, as (text, font_size, color)
+_COMMON_LABELS = (
+    ("Relay Chain", 24, WHITE),
+    ("Governance", 28, WHITE),
+    ("Council", 18, WHITE),
+    ("Tech Comm", 18, WHITE),
+    ("Referendum", 18, WHITE),
+)
+
+
+def warm_text_cache(labels=_COMMON_LABELS) -> None:
+    """Shape the given (text, font_size, color) labels ahead of the first scene."""
+    for text, font_size, color in labels:
+        _text_template(text, font_size, color)
+
+
+def warm_fonts(font_sizes=(24,)) -> None:
+    """Resolve the font chain and load the face at each size, caching nothing.
+
+    Shapes a throwaway sample per size, so the first real label doesn't pay
+    for font loading while no cache space goes to text no scene displays.
     """
-    # Attempt to register bundled Unbounded fonts once per process
+    for font_size in font_sizes:
+        _create_text_with_font_chain(text="Ag", font_size=font_size, color=WHITE)
+
+
+# Register bundled Unbounded fonts once per process, off the create_text path,
+# then shape the component labels so the first scene doesn't pay for them
+try:
     register_unbounded_fonts()
-    return _create_text_with_font_chain(text=text, font_size=font_size, color=color)
+    warm_text_cache()
+except Exception:
+    pass
+
+
+# Parsed MathTex templates keyed by tex source and options; callers get copies
+_MATHTEX_CACHE = {}
+
+
+def cached_mathtex(tex, **kwargs):
+    """Create MathTex, copying a cached template for repeated formulas.
+
+    Manim already keeps compiled SVGs in its tex_dir, so LaTeX runs once per
+    formula across renders; this also skips re-parsing that SVG in-process.
+    """
+    key = (tex, repr(sorted(kwargs.items())))
+    template = _MATHTEX_CACHE.get(key)
+    if template is None:
+        template = MathTex(tex, **kwargs)
+        _MATHTEX_CACHE[key] = template
+    return template.copy()
 
 
 def create_text_with_background(text,
@@ -167,6 +286,30 @@ def create_text_with_background(text,
     return text_group
 
 
+_SHAPE_TEMPLATES = {}
+
+
+def _copy_shape(key, build):
+    """Return a copy of a cached shape template, building it on first use.
+
+    Component shapes of the same geometry only differ in style and position,
+    so the bezier points are generated once and cloned afterwards.
+    """
+    template = _SHAPE_TEMPLATES.get(key)
+    if template is None:
+        template = _SHAPE_TEMPLATES[key] = build()
+    return template.copy()
+
+
+def _rounded_rect(width, height, corner_radius, color, fill_opacity, stroke_width):
+    """Copy of a cached, fully styled RoundedRectangle."""
+    return _copy_shape(
+        ("rounded_rect", width, height, corner_radius, str(color), fill_opacity, stroke_width),
+        lambda: RoundedRectangle(width=width, height=height, corner_radius=corner_radius,
+                                 color=color, fill_opacity=fill_opacity,
+                                 stroke_width=stroke_width))
+
+
 def _fallback_logo_mobject():
     """Return a simple brand-like fallback mobject when logo assets are unavailable."""
     # Simple circle with brand color and a centered dot text for visual identity
@@ -176,25 +319,46 @@ def _fallback_logo_mobject():
     return VGroup(circle, dot_text)
 
 
+# Parsed assets keyed by path, mtime and styling; callers always receive a copy
+_ASSET_CACHE = {}
+
+
+def _asset_mtime(path: str):
+    """Modification time of path, or None if it can't be read, so edited assets are reloaded."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
 def load_svg(path: str, color=None, stroke_color=None, stroke_width: float = 0.0):
     """Load an SVG asset as an SVGMobject with optional styling.
 
     Falls back to a simple brand mark if the SVG is missing or invalid.
     """
-    try:
-        svg = SVGMobject(path)
-        if color is not None:
-            svg.set_fill(color, opacity=1.0)
-        if stroke_color is not None:
-            svg.set_stroke(color=stroke_color, width=stroke_width)
-        return svg
-    except Exception:
-        return _fallback_logo_mobject()
+    key = ("svg", path, _asset_mtime(path), str(color), str(stroke_color), stroke_width)
+    template = _ASSET_CACHE.get(key)
+    if template is None:
+        try:
+            template = SVGMobject(path)
+            if color is not None:
+                template.set_fill(color, opacity=1.0)
+            if stroke_color is not None:
+                template.set_stroke(color=stroke_color, width=stroke_width)
+        except Exception:
+            # Not cached, so an asset added later is picked up on the next call
+            return _fallback_logo_mobject()
+        _ASSET_CACHE[key] = template
+    return template.copy()
 
 
 def load_image(path: str):
     """Load a raster image (png/jpg) as an ImageMobject."""
-    return ImageMobject(path)
+    key = ("image", path, _asset_mtime(path))
+    template = _ASSET_CACHE.get(key)
+    if template is None:
+        template = _ASSET_CACHE[key] = ImageMobject(path)
+    return template.copy()
 
 
 def load_logo(path: str, width: float = None, height: float = None):
@@ -225,10 +389,14 @@ def _rect_from_mobject(mobj, padding: float = 0.0):
     return (center[0] - half_w, center[0] + half_w, center[1] - half_h, center[1] + half_h)
 
 
-def _rects_overlap(a, b) -> bool:
-    ax0, ax1, ay0, ay1 = a
-    bx0, bx1, by0, by1 = b
-    return not (ax1 < bx0 or bx1 < ax0 or ay1 < by0 or by1 < ay0)
+def _rects_clear_of(rects, others):
+    """For each row of an (N, 4) rectangle array, True if it overlaps no row of an (M, 4) one."""
+    a = rects[:, None, :]
+    separated = ((a[..., 1] < others[:, 0]) | (others[:, 1] < a[..., 0])
+                 | (a[..., 3] < others[:, 2]) | (others[:, 3] < a[..., 2]))
+    return separated.all(axis=1)
+
+
 def clamp_to_frame(mobj,
                    margin: float = 0.3,
                    respect_top: bool = True,
@@ -236,18 +404,16 @@ def clamp_to_frame(mobj,
                    respect_left: bool = True,
                    respect_right: bool = True):
     """Clamp a mobject fully within the current frame bounds with optional margins."""
-    frame_w = config.frame_width
-    frame_h = config.frame_height
-    pos = mobj.get_center().copy()
-    left_limit = (-frame_w / 2) + (mobj.width / 2) + margin
-    right_limit = (frame_w / 2) - (mobj.width / 2) - margin
-    bottom_limit = (-frame_h / 2) + (mobj.height / 2) + margin
-    top_limit = (frame_h / 2) - (mobj.height / 2) - margin
-    if respect_left or respect_right:
-        pos[0] = min(right_limit, max(left_limit, pos[0]))
-    if respect_bottom or respect_top:
-        pos[1] = min(top_limit, max(bottom_limit, pos[1]))
-    mobj.move_to(pos)
+    center = mobj.get_center()
+    # Farthest the center may sit from the origin on each axis; np.clip resolves
+    # a negative reach (mobj larger than the frame) to the upper limit, like min(max())
+    reach = (np.array([config.frame_width - mobj.width, config.frame_height - mobj.height]) / 2
+             - margin)
+    clamped = np.where([respect_left or respect_right, respect_bottom or respect_top],
+                       np.clip(center[:2], -reach, reach), center[:2])
+    # Already inside: skip the move, which would walk mobj's whole family
+    if (clamped != center[:2]).any():
+        mobj.move_to(np.append(clamped, center[2]))
     return mobj
 
 
@@ -259,9 +425,9 @@ def safe_next_to(mobj, target, direction, buff=0.3, margin: float = 0.3):
 
 def fit_to_frame(mobj, max_ratio: float = 0.9):
     """Scale down mobject so it fits within frame width/height * max_ratio."""
-    frame_w = config.frame_width * max_ratio
-    frame_h = config.frame_height * max_ratio
-    scale_factor = min(frame_w / mobj.width, frame_h / mobj.height, 1.0)
+    scale_factor = _fit_scale(mobj.width, mobj.height,
+                              config.frame_width * max_ratio,
+                              config.frame_height * max_ratio)
     if scale_factor < 1.0:
         mobj.scale(scale_factor)
     clamp_to_frame(mobj)
@@ -288,15 +454,32 @@ def push_above_ring(label: VGroup, ring: Annulus, buffer: float = 0.35):
 
 def resolve_overlap(a: VGroup, b: VGroup, direction=DOWN, step: float = 0.1, max_steps: int = 20):
     """Shift 'a' repeatedly in direction until it no longer overlaps 'b'."""
-    def rect(m):
-        c = m.get_center()
-        return [c[0] - m.width / 2, c[0] + m.width / 2, c[1] - m.height / 2, c[1] + m.height / 2]
-    def overlap(r1, r2):
-        return not (r1[1] < r2[0] or r2[1] < r1[0] or r1[3] < r2[2] or r2[3] < r1[2])
-    steps = 0
-    while overlap(rect(a), rect(b)) and steps < max_steps:
-        a.shift(direction * step)
-        steps += 1
+    # Measure both once and slide a's rectangle numerically, then shift the mobject once
+    ax0, ax1, ay0, ay1 = _rect_from_mobject(a)
+    bx0, bx1, by0, by1 = _rect_from_mobject(b)
+    dx, dy = np.asarray(direction, dtype=float)[:2] * step
+    steps = _shift_until_clear(float(ax0), float(ax1), float(ay0), float(ay1),
+                               float(bx0), float(bx1), float(by0), float(by1),
+                               float(dx), float(dy), int(max_steps))
+    if steps:
+        a.shift(direction * (step * steps))
+    return a
+
+
+def resolve_overlap_exact(a: VGroup, b: VGroup, direction=DOWN, buffer: float = 0.05):
+    """Shift 'a' along direction by just enough to clear 'b', plus buffer, in one step."""
+    ax0, ax1, ay0, ay1 = _rect_from_mobject(a)
+    bx0, bx1, by0, by1 = _rect_from_mobject(b)
+    unit = np.asarray(direction, dtype=float)
+    norm = math.hypot(unit[0], unit[1])
+    if norm == 0.0:
+        return a
+    unit = unit / norm
+    distance = _separation_distance(float(ax0), float(ax1), float(ay0), float(ay1),
+                                    float(bx0), float(bx1), float(by0), float(by1),
+                                    float(unit[0]), float(unit[1]))
+    if distance > 0.0:
+        a.shift(unit * (distance + buffer))
     return a
 
 
@@ -343,31 +526,35 @@ class ChainBadge(VGroup):
 
         # Load logo (robust to SVG/raster)
         self.logo = load_logo(logo_path)
-        # Create label
-        self.label = create_text(name, font_size=20, color=WHITE)
+        # Create label; an empty name gives a logo-only badge
+        self.label = create_text(name, font_size=20, color=WHITE) if name else None
 
         # Layout
         if layout == "horizontal":
             self.logo.height = 0.6
-            self.label.next_to(self.logo, RIGHT, buff=0.25)
-            contents = VGroup(self.logo, self.label)
+            if self.label is not None:
+                self.label.next_to(self.logo, RIGHT, buff=0.25)
         else:
             # vertical
             self.logo.width = max_width * 0.7
-            self.label.next_to(self.logo, DOWN, buff=0.18)
-            contents = VGroup(self.logo, self.label)
-
-        # Accent underline for a polished look
-        underline = Line(self.label.get_left() + DOWN * 0.1,
-                         self.label.get_right() + DOWN * 0.1,
-                         color=palette_color,
-                         stroke_width=2)
-
-        group = VGroup(contents, underline)
+            if self.label is not None:
+                self.label.next_to(self.logo, DOWN, buff=0.18)
+
+        if self.label is not None:
+            # Accent underline for a polished look
+            underline = Line(self.label.get_left() + DOWN * 0.1,
+                             self.label.get_right() + DOWN * 0.1,
+                             color=palette_color,
+                             stroke_width=2)
+            group = VGroup(VGroup(self.logo, self.label), underline)
+        else:
+            group = VGroup(VGroup(self.logo))
 
         # Auto-fit to max_width
-        if group.width > max_width:
-            group.scale_to_fit_width(max_width)
+        # Measure once and scale by the ratio rather than re-measuring in scale_to_fit_width
+        group_width = group.width
+        if group_width > max_width:
+            group.scale(max_width / group_width)
 
         self.add(group)
 
@@ -396,14 +583,18 @@ class Phase:
         # Track existing objects to know what's new during the phase
         self._enter_index = len(self.scene.mobjects)
         if self.dim:
-            self._dim_rect = RoundedRectangle(
-                width=config.frame_width * 1.1,
-                height=config.frame_height * 1.1,
-                corner_radius=0.1,
-                fill_opacity=0.6,
-                stroke_opacity=0,
-                color=BLACK,
-            )
+            frame_w, frame_h = config.frame_width, config.frame_height
+            # Same overlay for every phase at a given frame size; clone the cached one
+            self._dim_rect = _copy_shape(
+                ("dim", frame_w, frame_h),
+                lambda: RoundedRectangle(
+                    width=frame_w * 1.1,
+                    height=frame_h * 1.1,
+                    corner_radius=0.1,
+                    fill_opacity=0.6,
+                    stroke_opacity=0,
+                    color=BLACK,
+                ))
             self.scene.play(FadeIn(self._dim_rect, run_time=0.35))
         return self
 
@@ -423,7 +614,10 @@ class Phase:
 
 # ===== REGISTRY & THEMING =====
 
-_CHAIN_REGISTRY_CACHE = None
+# Parsed registries keyed by path, and themes resolved from the default one
+_CHAIN_REGISTRY_CACHE = {}
+_CHAIN_THEME_CACHE = {}
+_REGISTRY_DEFAULT_PATH = Path(__file__).resolve().parent / "chains.json"
 
 
 def load_chain_registry(path: str = None):
@@ -431,36 +625,36 @@ def load_chain_registry(path: str = None):
 
     Default location: <repo_root>/chains.json if present.
     """
-    global _CHAIN_REGISTRY_CACHE
-    if _CHAIN_REGISTRY_CACHE is not None:
-        return _CHAIN_REGISTRY_CACHE
+    registry_path = Path(path) if path else _REGISTRY_DEFAULT_PATH
+    registry = _CHAIN_REGISTRY_CACHE.get(registry_path)
+    if registry is not None:
+        return registry
 
     try:
-        base_dir = Path(__file__).resolve().parent
-        default_path = base_dir / "chains.json"
-        registry_path = Path(path) if path else default_path
-        if registry_path.exists():
-            import json
-            with open(registry_path, "r") as f:
-                _CHAIN_REGISTRY_CACHE = json.load(f)
-        else:
-            _CHAIN_REGISTRY_CACHE = {}
+        with open(registry_path, "rb") as f:
+            registry = _json_loads(f.read())
     except Exception:
-        _CHAIN_REGISTRY_CACHE = {}
-    return _CHAIN_REGISTRY_CACHE
+        # Missing or malformed registry: behave as an empty one
+        registry = {}
+    _CHAIN_REGISTRY_CACHE[registry_path] = registry
+    return registry
 
 
 def get_chain_theme(chain_id: str, registry: dict = None):
     """Return (name, logo_path, color) for a chain_id if present, else None."""
+    # Themes from the default registry never change within a process
+    if registry is None and chain_id in _CHAIN_THEME_CACHE:
+        return _CHAIN_THEME_CACHE[chain_id]
     reg = registry if registry is not None else load_chain_registry()
     data = reg.get(chain_id)
-    if not data:
-        return None
-    return (
+    theme = (
         data.get("name", chain_id),
         data.get("logo", None),
         data.get("color", POLKADOT_PINK),
-    )
+    ) if data else None
+    if registry is None:
+        _CHAIN_THEME_CACHE[chain_id] = theme
+    return theme
 
 
 def make_badge_from_registry(chain_id: str, layout: str = "vertical", max_width: float = 2.6, registry: dict = None):
@@ -504,6 +698,16 @@ def animate_xcm(scene,
 
 
 
+# Candidate anchors as unit offsets, in fallback order: the four corners,
+# then the bottom/top/left/right edges, with the center always last
+_CANDIDATE_ANCHORS = np.array([
+    [-1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, -1.0, 0.0], [1.0, -1.0, 0.0],
+    [0.0, -1.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0],
+])
+_PREFERRED_ANCHOR = {"bottom": 4, "top": 5, "left": 6, "right": 7, "center": 8}
+
+
 def find_safe_position(scene,
                        mobj,
                        avoid: List[VGroup],
@@ -513,58 +717,37 @@ def find_safe_position(scene,
 
     preferred: one of "bottom", "top", "left", "right", "center", or "auto".
     """
-    # Compute frame bounds from config rather than requiring MovingCamera
-    frame_w = config.frame_width
-    frame_h = config.frame_height
-    center = np.array([0.0, 0.0, 0.0])
-    top = np.array([0.0, frame_h / 2, 0.0])
-    bottom = np.array([0.0, -frame_h / 2, 0.0])
-    left_edge = np.array([-frame_w / 2, 0.0, 0.0])
-    right_edge = np.array([frame_w / 2, 0.0, 0.0])
-
-    candidates = []
-    # Order candidates by preference
-    mapping = {
-        "bottom": [bottom + UP * (mobj.height / 2 + margin)],
-        "top": [top + DOWN * (mobj.height / 2 + margin)],
-        "left": [left_edge + RIGHT * (mobj.width / 2 + margin)],
-        "right": [right_edge + LEFT * (mobj.width / 2 + margin)],
-        "center": [center],
-        "auto": [],
-    }
-    if preferred in mapping:
-        candidates.extend(mapping[preferred])
-
-    # Enrich with corners and remaining edges
-    corners = [
-        np.array([-frame_w / 2, frame_h / 2, 0.0]) + (RIGHT * (mobj.width / 2 + margin) + DOWN * (mobj.height / 2 + margin)),
-        np.array([frame_w / 2, frame_h / 2, 0.0]) + (LEFT * (mobj.width / 2 + margin) + DOWN * (mobj.height / 2 + margin)),
-        np.array([-frame_w / 2, -frame_h / 2, 0.0]) + (RIGHT * (mobj.width / 2 + margin) + UP * (mobj.height / 2 + margin)),
-        np.array([frame_w / 2, -frame_h / 2, 0.0]) + (LEFT * (mobj.width / 2 + margin) + UP * (mobj.height / 2 + margin)),
-    ]
-    edges = [
-        bottom + UP * (mobj.height / 2 + margin),
-        top + DOWN * (mobj.height / 2 + margin),
-        left_edge + RIGHT * (mobj.width / 2 + margin),
-        right_edge + LEFT * (mobj.width / 2 + margin),
-    ]
-    for p in corners + edges:
-        if all((p != c).any() for c in candidates):
-            candidates.append(p)
-
-    # Always include center last as a fallback
-    if not any(np.allclose(center, c) for c in candidates):
-        candidates.append(center)
-
-    # Try candidates and return the first that doesn't overlap
-    for pos in candidates:
-        mobj.move_to(pos)
-        rect = _rect_from_mobject(mobj, padding=margin)
-        overlaps = any(_rects_overlap(rect, _rect_from_mobject(a)) for a in avoid)
-        if not overlaps:
-            # Ensure final position is clamped in frame
-            clamp_to_frame(mobj, margin=margin)
-            return mobj.get_center()
+    # Scale the anchor patterns by how far mobj's center may travel from the origin
+    # (frame bounds come from config rather than requiring MovingCamera)
+    reach = np.array([config.frame_width / 2 - (mobj.width / 2 + margin),
+                      config.frame_height / 2 - (mobj.height / 2 + margin),
+                      0.0])
+    order = np.arange(len(_CANDIDATE_ANCHORS))
+    first = _PREFERRED_ANCHOR.get(preferred)
+    if first is not None:
+        order = np.concatenate(([first], np.delete(order, first)))
+    candidates = _CANDIDATE_ANCHORS[order] * reach
+
+    # Anchors coincide when mobj spans the frame; keep first occurrences in order
+    _, keep = np.unique(candidates.round(6) + 0.0, axis=0, return_index=True)
+    candidates = candidates[np.sort(keep)]
+
+    # Avoid rectangles don't move between candidates; measure them once
+    avoid_rects = np.array([_rect_from_mobject(a) for a in avoid],
+                           dtype=float).reshape(-1, 4)
+
+    # mobj's padded rectangle at every candidate, tested against every avoid
+    # rectangle at once; take the first candidate that doesn't overlap
+    half_w = mobj.width / 2 + margin
+    half_h = mobj.height / 2 + margin
+    candidate_rects = np.column_stack((candidates[:, 0] - half_w, candidates[:, 0] + half_w,
+                                       candidates[:, 1] - half_h, candidates[:, 1] + half_h))
+    clear = np.flatnonzero(_rects_clear_of(candidate_rects, avoid_rects))
+    if clear.size:
+        mobj.move_to(candidates[clear[0]])
+        # Ensure final position is clamped in frame
+        clamp_to_frame(mobj, margin=margin)
+        return mobj.get_center()
 
     # If all else fails, return the first candidate (will overlap) so caller may add background/dim
     return candidates[0]
@@ -605,10 +788,206 @@ def display_text_safely(scene,
     return group
 
 
+_HEX_CACHE = {}
+
+
 def hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
     """Convert hex color to RGB tuple with values from 0 to 1"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    rgb = _HEX_CACHE.get(hex_color)
+    if rgb is None:
+        digits = hex_color.lstrip('#')
+        rgb = tuple(int(digits[i:i + 2], 16) / 255 for i in (0, 2, 4))
+        _HEX_CACHE[hex_color] = rgb
+    return rgb
+
+
+@_njit(cache=True)
+def _hex_digits_to_rgb(codes):
+    """Parse an (N, 6) uint8 array of lowercase hex digits into (N, 3) floats in [0, 1]."""
+    n = codes.shape[0]
+    out = np.empty((n, 3))
+    for i in range(n):
+        for c in range(3):
+            hi = codes[i, 2 * c]
+            lo = codes[i, 2 * c + 1]
+            # '0'-'9' are 48-57 and 'a'-'f' are 97-102
+            hi = hi - 48 - 39 * (hi >= 97)
+            lo = lo - 48 - 39 * (lo >= 97)
+            out[i, c] = (hi * 16 + lo) / 255.0
+    return out
+
+
+def hex_list_to_rgb_array(hex_colors) -> np.ndarray:
+    """Convert a sequence of hex colors to an (N, 3) float array with values from 0 to 1"""
+    digits = "".join(c.lstrip('#').lower() for c in hex_colors).encode("ascii")
+    codes = np.frombuffer(digits, dtype=np.uint8).reshape(-1, 6)
+    return _hex_digits_to_rgb(codes)
+
+
+BRAND_PALETTE = (POLKADOT_PINK, POLKADOT_BLACK, POLKADOT_WHITE, POLKADOT_LIME,
+                 POLKADOT_CYAN, POLKADOT_VIOLET, POLKADOT_STORM_200,
+                 POLKADOT_STORM_400, POLKADOT_STORM_700, ACALA_COLOR,
+                 MOONBEAM_COLOR, ASTAR_COLOR, PARALLEL_COLOR, CENTRIFUGE_COLOR)
+BRAND_PALETTE_RGB = hex_list_to_rgb_array(BRAND_PALETTE)
+
+# Preload the brand palette so known colors never hit the parser
+_HEX_CACHE.update((c, tuple(rgb)) for c, rgb in zip(BRAND_PALETTE, BRAND_PALETTE_RGB.tolist()))
+
+
+# ===== GEOMETRY KERNELS =====
+
+
+@_njit(cache=True)
+def _fit_scale(width, height, max_width, max_height):
+    """Largest scale factor <= 1 that fits width x height inside max_width x max_height."""
+    return min(max_width / width, max_height / height, 1.0)
+
+
+@_njit(cache=True)
+def _shift_until_clear(ax0, ax1, ay0, ay1, bx0, bx1, by0, by1, dx, dy, max_steps):
+    """Number of (dx, dy) steps until rectangle a stops overlapping b, capped at max_steps."""
+    steps = 0
+    while (steps < max_steps and ax1 >= bx0 and bx1 >= ax0
+           and ay1 >= by0 and by1 >= ay0):
+        ax0 += dx
+        ax1 += dx
+        ay0 += dy
+        ay1 += dy
+        steps += 1
+    return steps
+
+
+@_njit(cache=True)
+def _separation_distance(ax0, ax1, ay0, ay1, bx0, bx1, by0, by1, ux, uy):
+    """Distance along unit (ux, uy) that moves rectangle a out of b; 0 if they don't overlap."""
+    if not (ax1 >= bx0 and bx1 >= ax0 and ay1 >= by0 and by1 >= ay0):
+        return 0.0
+    # Clearing either axis is enough, so take the shorter of the two pushes
+    best = math.inf
+    if ux > 0.0:
+        best = min(best, (bx1 - ax0) / ux)
+    elif ux < 0.0:
+        best = min(best, (ax1 - bx0) / -ux)
+    if uy > 0.0:
+        best = min(best, (by1 - ay0) / uy)
+    elif uy < 0.0:
+        best = min(best, (ay1 - by0) / -uy)
+    return best
+
+
+@_njit(cache=True)
+def _ring_positions(n, radius):
+    """Return an (n, 3) array of points evenly spaced on a circle at the origin."""
+    out = np.zeros((n, 3))
+    for i in range(n):
+        angle = i * 2.0 * math.pi / n
+        out[i, 0] = radius * math.cos(angle)
+        out[i, 1] = radius * math.sin(angle)
+    return out
+
+
+# Unit hexagon vertices; validators scale this by their size
+_HEX_UNIT = _ring_positions(6, 1.0)
+
+
+@_njit(cache=True)
+def _connection_point(center, target, ring_radius):
+    """Return (point on ring facing target, unit direction from center to target)."""
+    dx = target[0] - center[0]
+    dy = target[1] - center[1]
+    dz = target[2] - center[2]
+    # Nested hypot keeps z general on 3.7 and numba; coincident centers get a zero direction
+    norm = math.hypot(math.hypot(dx, dy), dz)
+    inv = 1.0 / norm if norm > 0.0 else 0.0
+    unit = np.empty(3)
+    unit[0] = dx * inv
+    unit[1] = dy * inv
+    unit[2] = dz * inv
+    point = np.empty(3)
+    for k in range(3):
+        point[k] = center[k] + unit[k] * ring_radius
+    return point, unit
+
+
+@_njit(cache=True, fastmath=True)
+def _connection_endpoints(centers, ring_center, ring_radius, para_radii):
+    """Return (starts, ends) of relay-to-parachain lines for (n, 3) centers."""
+    n = centers.shape[0]
+    starts = np.empty_like(centers)
+    ends = np.empty_like(centers)
+    for i in range(n):
+        dx = centers[i, 0] - ring_center[0]
+        dy = centers[i, 1] - ring_center[1]
+        dz = centers[i, 2] - ring_center[2]
+        norm = math.hypot(math.hypot(dx, dy), dz)
+        inv = 1.0 / norm if norm > 0.0 else 0.0
+        ux, uy, uz = dx * inv, dy * inv, dz * inv
+        starts[i, 0] = ring_center[0] + ux * ring_radius
+        starts[i, 1] = ring_center[1] + uy * ring_radius
+        starts[i, 2] = ring_center[2] + uz * ring_radius
+        ends[i, 0] = centers[i, 0] - ux * para_radii[i]
+        ends[i, 1] = centers[i, 1] - uy * para_radii[i]
+        ends[i, 2] = centers[i, 2] - uz * para_radii[i]
+    return starts, ends
+
+
+@_njit(cache=True)
+def _arch_controls(start, end, lift, spread):
+    """Two control points arching above the start-end midpoint.
+
+    The arch rises lift * distance and the points sit spread apart horizontally.
+    """
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    dz = end[2] - start[2]
+    rise = lift * math.sqrt(dx * dx + dy * dy + dz * dz)
+    ctrl1 = np.empty(3)
+    ctrl2 = np.empty(3)
+    for k in range(3):
+        mid = (start[k] + end[k]) / 2
+        ctrl1[k] = mid
+        ctrl2[k] = mid
+    ctrl1[0] -= spread
+    ctrl2[0] += spread
+    ctrl1[1] += rise
+    ctrl2[1] += rise
+    return ctrl1, ctrl2
+
+
+def _points_at_proportions(path, proportions, samples_per_curve: int = 16) -> np.ndarray:
+    """Points at the given fractions of arc length along a VMobject of cubic curves.
+
+    Every curve is sampled once into an array and all proportions are read from
+    its cumulative length table, instead of a point_from_proportion walk per point.
+    """
+    curves = path.points.reshape(-1, 4, 3)
+    t = np.linspace(0.0, 1.0, samples_per_curve)[:, None]
+    mt = 1.0 - t
+    # Cubic Bernstein weights, one row per sample parameter
+    weights = np.hstack((mt ** 3, 3 * mt ** 2 * t, 3 * mt * t ** 2, t ** 3))
+    samples = np.einsum("sk,ckd->csd", weights, curves).reshape(-1, 3)
+    lengths = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(samples, axis=0), axis=1))))
+    targets = np.asarray(proportions, dtype=float) * lengths[-1]
+    return np.column_stack([np.interp(targets, lengths, samples[:, k]) for k in range(3)])
+
+
+@_njit(cache=True, fastmath=True)
+def _normalize_rows(matrix):
+    """Scale each row of a 2-D float array in place to sum to 1; all-zero rows are left as is."""
+    for i in range(matrix.shape[0]):
+        total = 0.0
+        for j in range(matrix.shape[1]):
+            total += matrix[i, j]
+        if total != 0.0:
+            inv = 1.0 / total
+            for j in range(matrix.shape[1]):
+                matrix[i, j] *= inv
+    return matrix
+
+
+def row_stochastic(matrix) -> np.ndarray:
+    """Return a float copy of matrix with every row summing to 1 (a Markov transition matrix)."""
+    return _normalize_rows(np.array(matrix, dtype=np.float64))
 
 
 # ===== COMPONENTS =====
@@ -664,19 +1043,16 @@ class PolkadotRelay(VGroup):
 
         # Add validators (represented as dots around the relay chain)
         self.validators = VGroup()
+        self.validator_positions = np.zeros((0, 3))
         if include_dots:
-            for i in range(n_validators):
-                angle = i * TAU / n_validators
-                # Place validators centered within ring thickness and reduce size for elegance
-                ring_mid_r = (self.ring.inner_radius + self.ring.outer_radius) / 2
-                pos = np.array([
-                    ring_mid_r * np.cos(angle),
-                    ring_mid_r * np.sin(angle),
-                    0,
-                ])
-                dot = Dot(pos, color=WHITE, radius=0.06)
-                dot.set_fill(color, opacity=0.9)
-                self.validators.add(dot)
+            # Place validators centered within ring thickness and reduce size for elegance
+            ring_mid_r = (self.ring.inner_radius + self.ring.outer_radius) / 2
+            self.validator_positions = _ring_positions(n_validators, ring_mid_r)
+            # All dots share one style: style a cached dot once and clone it per position
+            template = _copy_shape(("dot", 0.06), lambda: Dot(ORIGIN, color=WHITE, radius=0.06))
+            template.set_fill(color, opacity=0.9)
+            self.validators.add(*(template.copy().move_to(pos)
+                                  for pos in self.validator_positions))
             self.add(self.validators)
 
     def connect_parachain(self, parachain, animate=False):
@@ -685,10 +1061,8 @@ class PolkadotRelay(VGroup):
         self.parachains.append(parachain)
 
         # Calculate connection point on relay
-        direction = parachain.get_center() - self.ring.get_center()
-        direction_norm = direction / np.linalg.norm(direction)
-        connection_point = self.ring.get_center(
-        ) + direction_norm * self.radius
+        connection_point, direction_norm = _connection_point(
+            self.ring.get_center(), parachain.get_center(), self.radius)
 
         # Create connection line
         line = Line(connection_point,
@@ -705,6 +1079,27 @@ class PolkadotRelay(VGroup):
             # Just return the elements to be added
             return VGroup(line, parachain)
 
+    def connect_parachains(self, parachains, animate=False):
+        """Connect several parachains, computing all endpoints in one pass"""
+        parachains = list(parachains)
+        centers = np.array([p.get_center() for p in parachains],
+                           dtype=float).reshape(-1, 3)
+        radii = np.array([p.radius for p in parachains], dtype=float)
+        starts, ends = _connection_endpoints(
+            centers, self.ring.get_center(), float(self.radius), radii)
+
+        animations = []
+        group = VGroup()
+        for parachain, start, end in zip(parachains, starts, ends):
+            self.parachains.append(parachain)
+            line = Line(start, end, stroke_width=3, color=POLKADOT_CYAN)
+            self.connection_lines.append(line)
+            if animate:
+                animations += [Create(line), GrowFromCenter(parachain)]
+            else:
+                group.add(line, parachain)
+        return animations if animate else group
+
 
 class Parachain(VGroup):
     """
@@ -722,18 +1117,18 @@ class Parachain(VGroup):
         self.chain_name = name
 
         # Create the parachain circle
-        self.circle = Circle(
-            radius=radius,
-            stroke_width=2,
-            color=color,
-            fill_opacity=0.18,
-            fill_color=color)
+        self.circle = _copy_shape(
+            ("circle", radius),
+            lambda: Circle(radius=radius, stroke_width=2))
+        self.circle.set_stroke(color)
+        self.circle.set_fill(color, opacity=0.18)
 
         # Add the name label (auto-fit within circle)
         self.name = create_text(name, font_size=20, color=WHITE)
         max_label_width = self.circle.width * 0.78
-        if self.name.width > max_label_width:
-            self.name.scale_to_fit_width(max_label_width)
+        label_width = self.name.width
+        if label_width > max_label_width:
+            self.name.scale(max_label_width / label_width)
         self.name.move_to(self.circle.get_center())
 
         # Combine elements
@@ -756,14 +1151,12 @@ class Validator(VGroup):
         super().__init__(**kwargs)
 
         # Create hexagon shape for validator
-        self.hexagon = Polygon(
-            *[
-                np.array([size * np.cos(angle), size * np.sin(angle), 0])
-                for angle in np.linspace(0, TAU, 7)[:-1]
-            ],
-            color=color,
-            fill_opacity=0.8 if active else 0.3,  # More vibrant
-            stroke_width=3)  # Thicker stroke
+        self.hexagon = _copy_shape(
+            ("hexagon", size),
+            lambda: Polygon(*(_HEX_UNIT * size),
+                            stroke_width=3))  # Thicker stroke
+        self.hexagon.set_stroke(color)
+        self.hexagon.set_fill(color, opacity=0.8 if active else 0.3)  # More vibrant
         self.add(self.hexagon)
 
         # Add label if provided
@@ -846,16 +1239,18 @@ class Block(VGroup):
         super().__init__(**kwargs)
 
         # Create block shape
-        self.rect = RoundedRectangle(
-            height=size,
-            width=size * 1.6,  # Wider blocks
-            corner_radius=0.12,  # Rounder corners
-            color=color,
-            fill_opacity=0.6,  # More vibrant
-            stroke_width=2.5)  # Thicker stroke
-
-        # Optionally add block number/label
-        if label is not None:
+        self.rect = _copy_shape(
+            ("block", size),
+            lambda: RoundedRectangle(
+                height=size,
+                width=size * 1.6,  # Wider blocks
+                corner_radius=0.12,  # Rounder corners
+                stroke_width=2.5))  # Thicker stroke
+        self.rect.set_stroke(color)
+        self.rect.set_fill(color, opacity=0.6)  # More vibrant
+
+        # Optionally add block number/label (an empty string renders no text)
+        if label:
             self.label = create_text(label, font_size=18, color=WHITE)
             self.label.move_to(self.rect.get_center())
             self.add(self.rect, self.label)
@@ -902,9 +1297,9 @@ class XCMMessage(VGroup):
         super().__init__(**kwargs)
 
         # Create message container - slightly larger
-        self.container = RoundedRectangle(
-            height=0.7,
+        self.container = _rounded_rect(
             width=1.4,
+            height=0.7,
             corner_radius=0.15,
             color=color,
             fill_opacity=0.5,  # More vibrant
@@ -915,8 +1310,9 @@ class XCMMessage(VGroup):
         self.text.move_to(self.container.get_center())
         # Auto-fit text within container width, respecting padding
         max_text_width = self.container.width * 0.85
-        if self.text.width > max_text_width:
-            self.text.scale_to_fit_width(max_text_width)
+        text_width = self.text.width
+        if text_width > max_text_width:
+            self.text.scale(max_text_width / text_width)
 
         # Add to group
         self.add(self.container, self.text)
@@ -961,25 +1357,23 @@ class PolkadotEcosystem(VGroup):
 
         # Create parachains
         self.parachains = {}
-        angles = np.linspace(0, TAU, n_parachains, endpoint=False)
+        # Unit directions drive positions and both connection endpoints
+        relay_center = self.relay.get_center()
+        units = _ring_positions(n_parachains, 1.0)
+        positions = units * (relay_radius + 2.5)
+        ring_points = relay_center + units * relay_radius
+        conn_ends = positions - units
 
         for i in range(n_parachains):
-            angle = angles[i]
-            pos = np.array([(relay_radius + 2.5) * np.cos(angle),
-                            (relay_radius + 2.5) * np.sin(angle), 0])
-
             # Create parachain
             parachain = Parachain(name=parachain_names[i],
-                                  position=pos,
+                                  position=positions[i],
                                   color=parachain_colors[i],
                                   radius=1.0)
 
             # Connect to relay
-            connection = Line(self.relay.get_center() + np.array([
-                relay_radius * np.cos(angle), relay_radius * np.sin(angle), 0
-            ]),
-                              pos - np.array([np.cos(angle),
-                                              np.sin(angle), 0]),
+            connection = Line(ring_points[i],
+                              conn_ends[i],
                               color=POLKADOT_CYAN,
                               stroke_width=2)
 
@@ -1003,7 +1397,7 @@ class GovernanceSystem(VGroup):
         super().__init__(**kwargs)
 
         # Background
-        self.bg = RoundedRectangle(
+        self.bg = _rounded_rect(
             width=width,
             height=height,
             corner_radius=0.25,  # Rounder corners
@@ -1017,7 +1411,7 @@ class GovernanceSystem(VGroup):
         self.title.move_to(self.bg.get_top() + DOWN * 0.4)
 
         # Components - more consistent sizing and better visual hierarchy
-        self.council = RoundedRectangle(
+        self.council = _rounded_rect(
             width=1.8,
             height=0.7,
             corner_radius=0.15,
@@ -1029,7 +1423,7 @@ class GovernanceSystem(VGroup):
                                         color=WHITE)  # Larger text
         self.council_text.move_to(self.council.get_center())
 
-        self.tech = RoundedRectangle(
+        self.tech = _rounded_rect(
             width=1.8,
             height=0.7,
             corner_radius=0.15,
@@ -1041,7 +1435,7 @@ class GovernanceSystem(VGroup):
                                      color=WHITE)  # Larger text
         self.tech_text.move_to(self.tech.get_center())
 
-        self.referendum = RoundedRectangle(
+        self.referendum = _rounded_rect(
             width=2.2,
             height=0.7,
             corner_radius=0.15,
@@ -1065,36 +1459,41 @@ class GovernanceSystem(VGroup):
 
 # ===== ANIMATION PRESETS =====
 
+# Default random source for presets that pick elements at random
+_RNG = np.random.default_rng()
+
 
 def animate_block_production(scene, chain, n_blocks=5, duration=3.0, show_labels: bool = False):
     """
     Animate block production on a chain (relay or parachain)
     """
-    blocks = []
-    connections = []
     block_spacing = 0.6
     start_pos = chain.get_center() + UP * 1.5
+    step_time = duration / n_blocks
+    positions = start_pos + np.outer(np.arange(n_blocks) * block_spacing, RIGHT)
+
+    # Build every block and connector up front so plays run back to back
+    blocks = [
+        Block(position=positions[i],
+              label=f"#{i+1}" if show_labels else None,
+              color=POLKADOT_PINK)
+        for i in range(n_blocks)
+    ]
+    connections = [
+        Line(blocks[i - 1].get_right(),
+             blocks[i].get_left(),
+             color=POLKADOT_STORM_700)
+        for i in range(1, n_blocks)
+    ]
 
-    # Create and animate each block
-    for i in range(n_blocks):
-        block = Block(position=start_pos + RIGHT * (i * block_spacing),
-                      label=f"#{i+1}" if show_labels else None,
-                      color=POLKADOT_PINK)
-
+    # Animate each block, linked to its predecessor
+    for i, block in enumerate(blocks):
         if i == 0:
-            scene.play(Create(block), run_time=duration / n_blocks)
+            scene.play(Create(block), run_time=step_time)
         else:
-            prev_block = blocks[-1]
-            # Create connection line
-            conn = Line(prev_block.get_right(),
-                        block.get_left(),
-                        color=POLKADOT_STORM_700)
-            scene.play(Create(conn),
+            scene.play(Create(connections[i - 1]),
                        Create(block),
-                       run_time=duration / n_blocks)
-            connections.append(conn)
-
-        blocks.append(block)
+                       run_time=step_time)
 
     # Return a VGroup for easy cleanup by callers
     return VGroup(*blocks, *connections)
@@ -1110,23 +1509,26 @@ def animate_cross_chain_transfer(scene,
     end = dest_chain.get_center()
 
     # Curved path control points (arch above center)
-    mid = (start + end) / 2
-    control_offset = UP * np.linalg.norm(end - start) * 0.22
-    ctrl1 = mid + control_offset + LEFT * 0.3
-    ctrl2 = mid + control_offset + RIGHT * 0.3
+    ctrl1, ctrl2 = _arch_controls(start, end, 0.22, 0.3)
 
     path = VMobject()
     path.set_points_as_corners([start, ctrl1, ctrl2, end]).make_smooth()
     path.set_stroke(POLKADOT_CYAN, width=2.5, opacity=0.55)
 
-    # Moving message with glow
-    msg = XCMMessage(start=start, end=end, message=message)
-    glow = RoundedRectangle(height=msg.container.height * 1.4,
-                            width=msg.container.width * 1.4,
-                            corner_radius=0.2,
-                            color=POLKADOT_CYAN,
-                            fill_opacity=0.15,
-                            stroke_opacity=0)
+    # Moving message with glow, cloned from templates built on the first transfer
+    msg = _copy_shape(("xcm", message, POLKADOT_VIOLET),
+                      lambda: XCMMessage(message=message, color=POLKADOT_VIOLET))
+    msg.move_to(start)
+    msg.start_pos, msg.end_pos = start, end
+    glow_h = round(msg.container.height * 1.4, 2)
+    glow_w = round(msg.container.width * 1.4, 2)
+    glow = _copy_shape(("xcm_glow", glow_h, glow_w),
+                       lambda: RoundedRectangle(height=glow_h,
+                                                width=glow_w,
+                                                corner_radius=0.2,
+                                                color=POLKADOT_CYAN,
+                                                fill_opacity=0.15,
+                                                stroke_opacity=0))
     glow.move_to(msg.get_center())
 
     # Particles
@@ -1146,16 +1548,16 @@ def animate_cross_chain_transfer(scene,
         run_time=duration * 0.65)
 
     # Simple trailing particles: spawn along path with staggered fades
-    positions = [path.point_from_proportion(i / len(particles)) for i in range(len(particles))]
-    for i, p in enumerate(particles):
-        p.move_to(positions[i])
+    proportions = np.linspace(0.0, 1.0, len(particles), endpoint=False)
+    for p, point in zip(particles, _points_at_proportions(path, proportions)):
+        p.move_to(point)
     scene.play(FadeIn(particles, lag_ratio=0.1, run_time=duration * 0.2))
     scene.play(FadeOut(particles, lag_ratio=0.1, run_time=duration * 0.2), FadeOut(path, run_time=0.2))
 
     return VGroup(msg, glow)
 
 
-def animate_validator_set_change(scene, validators, n_new=2, duration=2.0):
+def animate_validator_set_change(scene, validators, n_new=2, duration=2.0, rng=None):
     """
     Animate validator set changing for era rotation
     
@@ -1164,22 +1566,24 @@ def animate_validator_set_change(scene, validators, n_new=2, duration=2.0):
         validators: A VGroup containing validator objects to change
         n_new: Number of validators to replace
         duration: Animation duration in seconds
+        rng: numpy Generator used to pick validators (pass a seeded one for reproducible renders)
     """
+    rng = rng if rng is not None else _RNG
     # Get positions of current validators
-    val_positions = [v.get_center() for v in validators]
+    val_positions = np.array([v.get_center() for v in validators])
 
     # Remove some validators
-    remove_idx = random.sample(range(len(val_positions)), n_new)
+    remove_idx = rng.choice(len(val_positions), size=n_new, replace=False)
     removal_animations = [
-        FadeOut(validators[i], run_time=duration / 2) for i in remove_idx
+        FadeOut(validators[int(i)], run_time=duration / 2) for i in remove_idx
     ]
     scene.play(*removal_animations)
 
     # Add new validators
     new_validators = VGroup()
-    for i in remove_idx:
+    for pos in val_positions[remove_idx]:
         # Create with different color initially
-        new_val = Validator(position=val_positions[i],
+        new_val = Validator(position=pos,
                             color=POLKADOT_VIOLET,
                             active=True)
         new_validators.add(new_val)
@@ -1194,6 +1598,11 @@ def animate_validator_set_change(scene, validators, n_new=2, duration=2.0):
 # ===== SUBTITLES & MEDIA HELPERS =====
 
 
+# Zero-padded digit strings for SRT timestamps
+_TWO_DIGIT = [f"{i:02d}" for i in range(100)]
+_THREE_DIGIT = [f"{i:03d}" for i in range(1000)]
+
+
 class SubtitleTrack:
     """Collects timed captions and exports to SRT.
 
@@ -1201,32 +1610,57 @@ class SubtitleTrack:
     """
 
     def __init__(self):
+        # Kept sorted by start time on insert; _starts mirrors the first column for bisect
         self._items: List[Tuple[float, float, str]] = []
+        self._starts: List[float] = []
 
     def add_caption(self, start_s: float, end_s: float, text: str) -> None:
         if end_s <= start_s:
             end_s = start_s + 0.01
-        self._items.append((start_s, end_s, text))
+        # bisect_right keeps captions with equal starts in insertion order
+        i = bisect_right(self._starts, start_s)
+        self._starts.insert(i, start_s)
+        self._items.insert(i, (start_s, end_s, text))
 
     @staticmethod
     def _format_ts(t: float) -> str:
-        hours = int(t // 3600)
-        minutes = int((t % 3600) // 60)
-        seconds = int(t % 60)
-        millis = int((t - int(t)) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+        return SubtitleTrack._format_ts_array([t])[0]
+
+    @staticmethod
+    def _format_ts_array(times) -> List[str]:
+        """Format many times at once: integer math in numpy, digits from lookup tables."""
+        millis = np.rint(np.asarray(times, dtype=np.float64) * 1000).astype(np.int64)
+        hours, millis = np.divmod(millis, 3_600_000)
+        minutes, millis = np.divmod(millis, 60_000)
+        seconds, millis = np.divmod(millis, 1000)
+        return [
+            f"{_TWO_DIGIT[h] if 0 <= h < 100 else h}:{_TWO_DIGIT[m]}:{_TWO_DIGIT[s]},{_THREE_DIGIT[ms]}"
+            for h, m, s, ms in zip(hours.tolist(), minutes.tolist(),
+                                   seconds.tolist(), millis.tolist())
+        ]
+
+    def _write_srt(self, f) -> None:
+        """Write the SRT entries to a text stream one at a time."""
+        if not self._items:
+            return
+        stamps = self._format_ts_array([t for item in self._items for t in item[:2]])
+        for idx, (_, _, text) in enumerate(self._items, start=1):
+            if idx > 1:
+                f.write("\n")
+            f.write(f"{idx}\n{stamps[2 * idx - 2]} --> {stamps[2 * idx - 1]}\n{text}\n")
 
     def to_srt(self) -> str:
-        lines = []
-        for idx, (start, end, text) in enumerate(sorted(self._items, key=lambda x: x[0]), start=1):
-            lines.append(str(idx))
-            lines.append(f"{self._format_ts(start)} --> {self._format_ts(end)}")
-            lines.append(text)
-            lines.append("")
-        return "\n".join(lines)
+        buf = io.StringIO()
+        self._write_srt(buf)
+        return buf.getvalue()
 
     def save(self, path: str) -> None:
-        Path(path).write_text(self.to_srt(), encoding="utf-8")
+        # Stream entries to a sibling temp file, then swap it in so readers
+        # (e.g. the ffmpeg burn step) never see a partial SRT
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            self._write_srt(f)
+        os.replace(tmp, path)
 
 
 class PlaybackClock:
@@ -1276,22 +1710,138 @@ class PlaybackClock:
             delattr(self.scene, "_dot_clock")
         return False
 
+    @classmethod
+    def install(cls, scene, json_path: str = None) -> "PlaybackClock":
+        """Run a clock on scene until it tears down, then save captions to json_path if given.
+
+        Lets a scene record its captions during its own render instead of a
+        separate clock-wrapped render.
+        """
+        clock = cls(scene).__enter__()
+        orig_tear_down = scene.tear_down
+
+        def tear_down():
+            clock.__exit__(None, None, None)
+            if json_path:
+                clock.save_json(json_path)
+            orig_tear_down()
+
+        scene.tear_down = tear_down
+        return clock
+
     def add_caption(self, start: float, end: float, text: str) -> None:
         self.captions.append((start, end, text))
 
     def save_json(self, path: str) -> None:
         import json
-        Path(path).write_text(json.dumps(self.captions, indent=2), encoding="utf-8")
+        tmp = Path(f"{path}.tmp")
+        tmp.write_bytes(json.dumps(self.captions, indent=2).encode("utf-8"))
+        os.replace(tmp, path)
+
+
+# Shared ffmpeg prefix: overwrite outputs, never read stdin, print errors only
+_FFMPEG_BASE = ("ffmpeg", "-y", "-nostdin", "-nostats", "-hide_banner", "-loglevel", "error")
+
+
+def render_parallel(scene_file: str,
+                    scene_name: str,
+                    n_animations: int,
+                    output_video: str,
+                    n_workers: int = None,
+                    quality: str = "m",
+                    media_dir: str = ".dotmotion_media/parallel") -> str:
+    """Render one scene as contiguous animation ranges in parallel manim processes.
+
+    n_animations is the scene's number of play() and wait() calls; the last
+    range always runs to the end, so a lower bound is enough. Each worker
+    renders its range with manim's -n option; earlier animations still run but
+    are skipped rather than rendered. The parts share codec, frame rate and
+    resolution, so they are concatenated without re-encoding.
+    Returns the output video path.
+    """
+    import tempfile
+    # manim treats an upper bound of 0 as "no bound", so ranges hold at least two animations
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, n_animations // 2))
+    bounds = np.linspace(0, n_animations, n_workers + 1).astype(int)
+    Path(media_dir).mkdir(parents=True, exist_ok=True)
+
+    # A fresh directory per run, so parts left by an earlier run (another
+    # quality, or an older version of the scene) can't be picked up
+    with tempfile.TemporaryDirectory(dir=media_dir) as run_dir:
+        media = Path(run_dir)
+
+        def render(idx):
+            # Separate media dirs keep the workers' partial movie files apart
+            part_dir = media / f"part_{idx:03d}"
+            first, last = bounds[idx], bounds[idx + 1] - 1
+            span = f"{first}" if idx == n_workers - 1 else f"{first},{last}"
+            subprocess.run(["manim", f"-q{quality}", "--media_dir", str(part_dir),
+                            "-n", span, scene_file, scene_name],
+                           check=True, stdout=subprocess.DEVNULL)
+            return next(part_dir.rglob(f"{scene_name}.mp4"))
+
+        # manim runs as a subprocess, so threads are enough to keep the renders going
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            parts = list(pool.map(render, range(n_workers)))
+
+        concat_videos(parts, output_video)
+    return output_video
 
 
-def attach_subtitles(input_video: str, srt_path: str, output_video: str) -> None:
-    """Hardcode subtitles into a video using ffmpeg (burn-in)."""
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", input_video,
-        "-vf", f"subtitles='{srt_path}'",
-        output_video,
-    ]
+def concat_videos(videos, output_video: str) -> str:
+    """Join videos that share codec, frame rate and resolution, without re-encoding.
+
+    Raises CalledProcessError if ffmpeg fails. Returns the output video path.
+    """
+    import tempfile
+    with tempfile.TemporaryDirectory() as work:
+        concat_list = Path(work) / "videos.txt"
+        # concat list entries are single-quoted; a quote is written as '\''
+        concat_list.write_text("".join(
+            "file '{}'\n".format(str(Path(video).resolve()).replace("'", "'\\''"))
+            for video in videos))
+        subprocess.run([*_FFMPEG_BASE, "-f", "concat", "-safe", "0", "-i", str(concat_list),
+                        "-c", "copy", output_video],
+                       check=True)
+    return output_video
+
+
+def _subtitles_filter(srt_path: str) -> str:
+    """ffmpeg subtitles filter for srt_path, escaped for both filter and filtergraph levels."""
+    value = re.sub(r"([\\':])", r"\\\1", srt_path)
+    value = re.sub(r"([\\'\[\],;])", r"\\\1", value)
+    return f"subtitles=filename={value}"
+
+
+def _soft_subtitle_codec(output_video: str) -> str:
+    """Subtitle codec for a soft track: MP4/MOV only carry mov_text; Matroska takes SRT as-is."""
+    return "srt" if output_video.lower().endswith(".mkv") else "mov_text"
+
+
+def attach_subtitles(input_video: str, srt_path: str, output_video: str, burn: bool = True) -> None:
+    """Add subtitles to a video using ffmpeg.
+
+    burn=True hardcodes them into the frames (full re-encode). burn=False muxes
+    a soft subtitle track with stream copy; players must support and enable it.
+    """
+    if burn:
+        cmd = [
+            *_FFMPEG_BASE,
+            "-i", input_video,
+            "-vf", _subtitles_filter(srt_path),
+            output_video,
+        ]
+    else:
+        cmd = [
+            *_FFMPEG_BASE,
+            "-i", input_video,
+            "-i", srt_path,
+            "-map", "0",
+            "-map", "1",
+            "-c", "copy",
+            "-c:s", _soft_subtitle_codec(output_video),
+            output_video,
+        ]
     try:
         subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception:
@@ -1302,7 +1852,7 @@ def attach_subtitles(input_video: str, srt_path: str, output_video: str) -> None
 def mux_audio(input_video: str, audio_path: str, output_video: str) -> None:
     """Mux external audio track into video using ffmpeg (no re-encode)."""
     cmd = [
-        "ffmpeg", "-y",
+        *_FFMPEG_BASE,
         "-i", input_video,
         "-i", audio_path,
         "-c", "copy",
@@ -1316,6 +1866,10 @@ def mux_audio(input_video: str, audio_path: str, output_video: str) -> None:
         pass
 
 
+# Concurrent gTTS requests issued by auto_narrate_and_subtitle
+_TTS_WORKERS = 8
+
+
 def synthesize_tts(text: str, output_mp3: str) -> None:
     """Optional TTS synthesis using gTTS (requires gTTS installed)."""
     try:
@@ -1327,6 +1881,74 @@ def synthesize_tts(text: str, output_mp3: str) -> None:
         pass
 
 
+def _synthesize_tts_cached(text: str, output_mp3, cache_dir: Path) -> None:
+    """synthesize_tts, reusing a clip stored under the SHA1 of the text when present."""
+    import shutil
+    cached = cache_dir / f"{hashlib.sha1(text.encode('utf-8')).hexdigest()}.mp3"
+    if cached.exists():
+        shutil.copyfile(cached, output_mp3)
+        return
+    # synthesize_tts fails silently; clear any stale clip (an earlier run's, or a
+    # failed batch split's) so only audio produced here gets cached
+    try:
+        Path(output_mp3).unlink()
+    except FileNotFoundError:
+        pass
+    synthesize_tts(text, str(output_mp3))
+    if Path(output_mp3).exists():
+        shutil.copyfile(output_mp3, cached)
+
+
+def _synthesize_tts_batch(texts, work: Path, output_paths) -> bool:
+    """Synthesize texts with one gTTS request and cut it into one clip per text.
+
+    Captions are joined with pause tokens and the result is split on detected
+    silences. Returns False (writing nothing usable) if the pieces don't match texts.
+    """
+    joined_mp3 = work / "tts_all.mp3"
+    synthesize_tts(" . . . ".join(texts), str(joined_mp3))
+    if not joined_mp3.exists():
+        return False
+    try:
+        probe = subprocess.run([
+            # Keeps ffmpeg's default log level: silencedetect reports on stderr
+            "ffmpeg", "-nostdin", "-hide_banner", "-i", str(joined_mp3),
+            "-af", "silencedetect=noise=-40dB:d=0.5",
+            "-f", "null", "-",
+        ], capture_output=True, text=True, check=True)
+    except Exception:
+        return False
+
+    # Speech runs from the end of one silence to the start of the next
+    silence_starts = [float(v) for v in re.findall(r"silence_start: (-?[\d.]+)", probe.stderr)]
+    silence_ends = [float(v) for v in re.findall(r"silence_end: ([\d.]+)", probe.stderr)]
+    segments = []
+    cursor = 0.0
+    for i, silence_start in enumerate(silence_starts):
+        if silence_start > cursor:
+            segments.append((cursor, silence_start))
+        if i >= len(silence_ends):
+            # Trailing silence runs to the end of the file
+            cursor = None
+            break
+        cursor = silence_ends[i]
+    if cursor is not None:
+        segments.append((cursor, None))
+    if len(segments) != len(texts):
+        return False
+
+    for (seg_start, seg_end), out_path in zip(segments, output_paths):
+        cmd = [*_FFMPEG_BASE, "-i", str(joined_mp3), "-ss", f"{seg_start:.3f}"]
+        if seg_end is not None:
+            cmd += ["-to", f"{seg_end:.3f}"]
+        cmd += ["-c", "copy", str(out_path)]
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            return False
+    return True
+
+
 def auto_narrate_and_subtitle(input_video: str,
                                captions: List[Tuple[float, float, str]],
                                output_video: str,
@@ -1334,9 +1956,24 @@ def auto_narrate_and_subtitle(input_video: str,
                                work_dir: str = ".dotmotion_media",
                                sequential: bool = True,
                                min_gap_s: float = 0.1,
-                               constrain_tts_to_caption: bool = False) -> str:
+                               constrain_tts_to_caption: bool = False,
+                               batch_tts: bool = False,
+                               safe_pipeline: bool = False,
+                               cache_dir: str = None,
+                               music_path: str = None,
+                               music_db: float = -20.0) -> str:
     """Create narration from captions (via gTTS), mux into video, and optionally burn-in subtitles.
 
+    Without burn_subtitles the captions are added as a soft subtitle track.
+    batch_tts: synthesize all captions in one gTTS request and split it on pauses,
+    falling back to one request per caption if the split doesn't line up.
+    safe_pipeline: mix, mux and subtitle in separate ffmpeg passes with
+    intermediate files (easier to debug) instead of a single pass.
+    cache_dir: where synthesized clips are kept by text hash for reuse across
+    captions and runs (default <work_dir>/tts_cache); use a separate directory
+    per voice or language.
+    music_path: optional background music mixed under the narration at
+    music_db (negative values lower volume), trimmed to the video length.
     Returns the final output video path.
     """
     work = Path(work_dir)
@@ -1345,16 +1982,10 @@ def auto_narrate_and_subtitle(input_video: str,
     # 1) Optionally normalize to sequential non-overlapping schedule
     ordered = list(captions)
     if sequential and ordered:
-        ordered.sort(key=lambda x: x[0])
-        current = max(0.0, ordered[0][0])
-        seq = []
-        for s, e, t in ordered:
-            duration = max(0.4, e - s)
-            start = current
-            end = start + duration
-            seq.append((start, end, t))
-            current = end + min_gap_s
-        ordered = seq
+        starts, durations, texts = _sorted_caption_arrays(ordered)
+        # Back to back from the first start, keeping each caption's duration
+        seq_starts = max(0.0, starts[0]) + _back_to_back_offsets(durations, min_gap_s)
+        ordered = list(zip(seq_starts.tolist(), (seq_starts + durations).tolist(), texts))
     # 1b) Build subtitle track
     track = SubtitleTrack()
     for start, end, text in ordered:
@@ -1362,34 +1993,47 @@ def auto_narrate_and_subtitle(input_video: str,
     srt_path = str(work / "captions.srt")
     track.save(srt_path)
 
-    # 2) TTS per caption
-    tts_files = []
-    for idx, (start, end, text) in enumerate(ordered):
-        mp3_path = work / f"tts_{idx:03d}.mp3"
-        synthesize_tts(text, str(mp3_path))
-        # Optionally time-stretch/compress to fit exact caption duration
-        if constrain_tts_to_caption:
-            target_duration = max(0.4, end - start)
+    # 2) TTS per caption; each gTTS call is a network round-trip, so issue them concurrently
+    mp3_paths = [work / f"tts_{idx:03d}.mp3" for idx in range(len(ordered))]
+    texts = [t for _, _, t in ordered]
+    if not (batch_tts and texts and _synthesize_tts_batch(texts, work, mp3_paths)):
+        tts_cache = Path(cache_dir) if cache_dir else work / "tts_cache"
+        tts_cache.mkdir(parents=True, exist_ok=True)
+        # Synthesize each distinct text once; repeats and later runs copy the cached clip
+        unique = {}
+        for text, mp3_path in zip(texts, mp3_paths):
+            unique.setdefault(text, mp3_path)
+        with ThreadPoolExecutor(max_workers=_TTS_WORKERS) as pool:
+            list(pool.map(lambda job: _synthesize_tts_cached(*job, tts_cache), unique.items()))
+        for text, mp3_path in zip(texts, mp3_paths):
+            if unique[text] != mp3_path:
+                _synthesize_tts_cached(text, mp3_path, tts_cache)
+    tts_files = [(start, str(mp3_path)) for (start, _, _), mp3_path in zip(ordered, mp3_paths)]
+
+    # Optionally time-stretch/compress to fit exact caption duration. Each ffmpeg
+    # run is single-threaded, so fit one caption per core
+    if constrain_tts_to_caption:
+        def fit(idx):
+            start, end, _ = ordered[idx]
             stretched = work / f"tts_{idx:03d}_fit.aac"
             try:
-                _fit_audio_to_duration(str(mp3_path), str(stretched), target_duration)
-                tts_files.append((start, str(stretched)))
+                cmd = _build_fit_cmd(str(mp3_paths[idx]), str(stretched), max(0.4, end - start))
+                if cmd:
+                    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    return (start, str(stretched))
             except Exception:
-                # Fallback to raw mp3 if stretching fails
-                tts_files.append((start, str(mp3_path)))
-        else:
-            tts_files.append((start, str(mp3_path)))
+                pass
+            # Already fits (or stretching failed): use the mp3 as is rather
+            # than copying MP3 data under an .aac name
+            return (start, str(mp3_paths[idx]))
 
-    # 3) Mix audios at offsets using ffmpeg adelay + amix
-    #    Build inputs and filtergraph
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            tts_files = list(pool.map(fit, range(len(ordered))))
+
+    # 3) Place clips at their offsets and build one narration stream
     inputs = []
-    filters = []
-    amix_inputs = []
-    for i, (start, mp3_path) in enumerate(tts_files):
+    for _, mp3_path in tts_files:
         inputs += ["-i", mp3_path]
-        delay_ms = int(max(0, start) * 1000)
-        filters.append(f"[{i}:a]adelay={delay_ms}|{delay_ms}[a{i}]")
-        amix_inputs.append(f"[a{i}]")
     if not inputs:
         # No audio; just attach subtitles if requested
         final_video = output_video
@@ -1399,12 +2043,66 @@ def auto_narrate_and_subtitle(input_video: str,
             final_video = temp_out
         else:
             final_video = input_video
+        if music_path:
+            add_background_music(final_video, music_path, output_video, music_db=music_db)
+            final_video = output_video
         return final_video
 
-    filtergraph = ";".join(filters) + f";{''.join(amix_inputs)}amix=inputs={len(tts_files)}:normalize=0[aout]"
+    def build_filtergraph(first_input):
+        if constrain_tts_to_caption and not _overlap_detected(ordered):
+            # Clips are fitted to non-overlapping captions: play them back to back
+            return _concat_filtergraph(ordered, first_input)
+        return _amix_filtergraph([start for start, _ in tts_files], first_input)
+
+    try:
+        Path(output_video).unlink()
+    except Exception:
+        pass
+
+    if not safe_pipeline:
+        # Single pass: mix narration, copy (or burn) video and add subtitles, no intermediates
+        graph = build_filtergraph(1)
+        cmd = [*_FFMPEG_BASE, "-i", input_video, *inputs]
+        next_input = len(tts_files) + 1
+        audio_out = "[aout]"
+        if music_path:
+            # Duck the music under the narration and stop at the end of the video
+            cmd += ["-i", music_path]
+            video_s = _probe_duration_seconds(input_video)
+            trim = f",atrim=duration={video_s:.3f}" if video_s > 0 else ""
+            graph += (f";[{next_input}:a]volume={10 ** (music_db / 20):.6f}[bg]"
+                      f";[aout][bg]amix=inputs=2:normalize=0{trim}[afinal]")
+            audio_out = "[afinal]"
+            next_input += 1
+        if burn_subtitles:
+            graph += f";[0:v]{_subtitles_filter(srt_path)}[vout]"
+            maps = ["-map", "[vout]", "-map", audio_out]
+            codecs = []
+        else:
+            cmd += ["-i", srt_path]
+            maps = ["-map", "0:v:0", "-map", audio_out, "-map", str(next_input)]
+            codecs = ["-c:v", "copy", "-c:s", _soft_subtitle_codec(output_video)]
+        cmd += ["-filter_complex", graph, *maps, *codecs, "-c:a", "aac", output_video]
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return output_video
+        except Exception:
+            # Fall through to the step-by-step pipeline
+            pass
+
+    filtergraph = build_filtergraph(0)
     mixed_audio = str(work / "narration.aac")
+    temp_muxed = str(work / "video_with_audio.mp4")
+    subbed = str(work / "narrated_temp.mp4") if music_path else output_video
+    # The helpers below fail silently; clear intermediates from earlier runs so
+    # a failed step can't hand a stale file to the next one
+    for stale in (mixed_audio, temp_muxed, subbed):
+        try:
+            Path(stale).unlink()
+        except FileNotFoundError:
+            pass
     cmd_mix = [
-        "ffmpeg", "-y",
+        *_FFMPEG_BASE,
         *inputs,
         "-filter_complex", filtergraph,
         "-map", "[aout]",
@@ -1417,29 +2115,70 @@ def auto_narrate_and_subtitle(input_video: str,
         pass
 
     # 4) Mux audio into video
-    temp_muxed = str(work / "video_with_audio.mp4")
     mux_audio(input_video, mixed_audio, temp_muxed)
 
-    # 5) Burn subtitles if requested
-    final_out = output_video
-    if burn_subtitles:
-        attach_subtitles(temp_muxed, srt_path, output_video)
-    else:
-        # move/copy muxed to output
+    # 5) Burn subtitles if requested, otherwise add them as a soft track (stream copy)
+    attach_subtitles(temp_muxed, srt_path, subbed, burn=burn_subtitles)
+    if not burn_subtitles and not Path(subbed).exists() and Path(temp_muxed).exists():
+        # Soft track not supported here: move/copy muxed to output
         try:
-            Path(output_video).unlink(missing_ok=True)
-        except Exception:
-            pass
-        try:
-            Path(temp_muxed).rename(output_video)
+            Path(temp_muxed).replace(subbed)
         except Exception:
             # fallback copy
             import shutil
-            shutil.copyfile(temp_muxed, output_video)
+            shutil.copyfile(temp_muxed, subbed)
+
+    # 6) Mix in background music, only over a video this run produced
+    if music_path and Path(subbed).exists():
+        add_background_music(subbed, music_path, output_video, music_db=music_db)
 
     return output_video
 
 
+def _overlap_detected(schedule) -> bool:
+    """True if any (start, end, ...) item begins before the previous one ends.
+
+    Items are compared in the given order, so an unsorted schedule also counts.
+    """
+    return any(nxt[0] < cur[1] for cur, nxt in zip(schedule, schedule[1:]))
+
+
+def _amix_filtergraph(starts, first_input: int = 0) -> str:
+    """Delay every input to its start time and mix them; handles overlapping clips.
+
+    Clip i is read from ffmpeg input first_input + i.
+    """
+    filters = []
+    for i, start in enumerate(starts):
+        delay_ms = int(max(0, start) * 1000)
+        filters.append(f"[{first_input + i}:a]adelay={delay_ms}|{delay_ms}[a{i}]")
+    mix_inputs = "".join(f"[a{i}]" for i in range(len(starts)))
+    return ";".join(filters) + f";{mix_inputs}amix=inputs={len(starts)}:normalize=0[aout]"
+
+
+def _concat_filtergraph(schedule, first_input: int = 0) -> str:
+    """Pad or trim each input to end at the next start and concatenate in one stream.
+
+    Only valid when inputs are sorted; a clip running past the next start is cut
+    there, so later clips never drift. Clip i is read from ffmpeg input first_input + i.
+    """
+    filters = []
+    last = len(schedule) - 1
+    for i, (start, _, _) in enumerate(schedule):
+        # concat needs one sample format; the lead-in silence goes on the first clip
+        chain = f"[{first_input + i}:a]aformat=sample_rates=44100:channel_layouts=stereo"
+        if i == 0 and start > 0:
+            delay_ms = int(start * 1000)
+            chain += f",adelay={delay_ms}|{delay_ms}"
+        if i < last:
+            slot = schedule[i + 1][0] - (0.0 if i == 0 else start)
+            # Trim too: an overrunning clip (unfitted, or encoder padding) would delay every later one
+            chain += f",apad=whole_dur={slot:.3f},atrim=duration={slot:.3f}"
+        filters.append(chain + f"[a{i}]")
+    concat_inputs = "".join(f"[a{i}]" for i in range(len(schedule)))
+    return ";".join(filters) + f";{concat_inputs}concat=n={len(schedule)}:v=0:a=1[aout]"
+
+
 def add_background_music(input_video: str, music_path: str, output_video: str, music_db: float = -20.0) -> None:
     """Mix background music under existing video audio using ffmpeg with simple volume ducking.
 
@@ -1448,14 +2187,17 @@ def add_background_music(input_video: str, music_path: str, output_video: str, m
     # If the input has no audio, this still works by mapping only music
     filtergraph = f"[1:a]volume={10 ** (music_db/20):.6f}[bg];[0:a][bg]amix=inputs=2:normalize=0[aout]"
     cmd = [
-        "ffmpeg", "-y",
+        *_FFMPEG_BASE,
         "-i", input_video,
         "-i", music_path,
         "-filter_complex", filtergraph,
         "-map", "0:v:0",
         "-map", "[aout]",
+        # Keep any soft subtitle track, e.g. from narrate_from_captions
+        "-map", "0:s?",
         "-c:v", "copy",
         "-c:a", "aac",
+        "-c:s", "copy",
         "-shortest",
         output_video,
     ]
@@ -1465,37 +2207,41 @@ def add_background_music(input_video: str, music_path: str, output_video: str, m
         pass
 
 
+# ffprobe results keyed by (path, mtime) so a rewritten file is probed again
+_PROBE_CACHE = {}
+
+
 def _probe_duration_seconds(audio_path: str) -> float:
     """Return audio duration in seconds using ffprobe; 0.0 on failure."""
+    try:
+        key = (audio_path, os.path.getmtime(audio_path))
+    except OSError:
+        return 0.0
+    duration = _PROBE_CACHE.get(key)
+    if duration is not None:
+        return duration
     try:
         out = subprocess.run([
             "ffprobe", "-v", "error", "-show_entries", "format=duration",
             "-of", "default=noprint_wrappers=1:nokey=1", audio_path
         ], capture_output=True, text=True, check=True)
-        return max(0.0, float(out.stdout.strip()))
+        duration = max(0.0, float(out.stdout.strip()))
     except Exception:
+        # Failures are not cached; the file may still be being written
         return 0.0
+    _PROBE_CACHE[key] = duration
+    return duration
 
 
-def _fit_audio_to_duration(input_audio: str, output_audio: str, target_seconds: float) -> None:
-    """Time-stretch/compress audio to match target duration using FFmpeg atempo.
+# atempo filterchains by tempo rounded to 4 decimals
+_ATEMPO_CHAINS = {}
 
-    - Preserves pitch (atempo).
-    - Supports factors outside [0.5, 2.0] by chaining atempo filters.
-    - Outputs AAC audio suitable for muxing.
-    """
-    original = _probe_duration_seconds(input_audio)
-    if original <= 0.0 or target_seconds <= 0.0:
-        # Best effort copy to output if probe failed
-        try:
-            import shutil
-            shutil.copyfile(input_audio, output_audio)
-            return
-        except Exception:
-            pass
-        raise RuntimeError("Invalid durations for audio stretch")
 
-    tempo = original / target_seconds  # >1 speeds up (shorter), <1 slows (longer)
+def _atempo_chain(tempo: float) -> str:
+    """atempo filterchain for tempo, split into steps within atempo's 0.5..2.0 range."""
+    chain = _ATEMPO_CHAINS.get(tempo)
+    if chain is not None:
+        return chain
     # Decompose tempo into chain of 0.5..2.0 multipliers
     parts = []
     remaining = tempo
@@ -1507,16 +2253,32 @@ def _fit_audio_to_duration(input_audio: str, output_audio: str, target_seconds:
         parts.append(0.5)
         remaining /= 0.5
     parts.append(remaining)
-    # Build filterchain
-    filt = ",".join([f"atempo={p:.6f}" for p in parts])
-    cmd = [
-        "ffmpeg", "-y",
+    chain = _ATEMPO_CHAINS[tempo] = ",".join([f"atempo={p:.6f}" for p in parts])
+    return chain
+
+
+def _build_fit_cmd(input_audio: str, output_audio: str, target_seconds: float):
+    """Return the ffmpeg argv that stretches input_audio to target_seconds.
+
+    Returns None if the durations can't be probed and [] if no stretch is needed
+    (the clip is at most target_seconds and within 3% of it).
+    """
+    original = _probe_duration_seconds(input_audio)
+    if original <= 0.0 or target_seconds <= 0.0:
+        return None
+
+    tempo = original / target_seconds  # >1 speeds up (shorter), <1 slows (longer)
+    if 0.97 < tempo <= 1.0:
+        # Slightly short clips are left as is (a 3% stretch is inaudible); long
+        # ones are always fitted so they can't overrun the caption window
+        return []
+    return [
+        *_FFMPEG_BASE,
         "-i", input_audio,
-        "-filter:a", filt,
+        "-filter:a", _atempo_chain(round(tempo, 4)),
         "-c:a", "aac",
         output_audio,
     ]
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 # ===== USER-DRIVEN NARRATION (TIMESTAMPS-IN) =====
@@ -1552,7 +2314,28 @@ def load_captions_from_csv(path: str):
     """Load captions from a CSV with headers start,end,text.
 
     Returns: List[Tuple[float, float, str]] preserving provided timings.
+    Uses pandas to parse large files when it is installed.
     """
+    try:
+        import pandas as pd
+    except Exception:
+        pd = None
+    if pd is not None:
+        try:
+            df = pd.read_csv(path, usecols=["start", "end", "text"], dtype=str,
+                             keep_default_na=False, encoding="utf-8")
+            starts = pd.to_numeric(df["start"], errors="coerce").to_numpy(dtype=float)
+            ends = pd.to_numeric(df["end"], errors="coerce").to_numpy(dtype=float)
+            texts = df["text"].to_numpy(dtype=object)
+            # Same rules as the csv loop below: drop unparsable times and empty text
+            keep = ~(np.isnan(starts) | np.isnan(ends)) & (texts != "")
+            starts, ends = starts[keep], ends[keep]
+            ends = np.where(ends <= starts, starts + 0.4, ends)
+            return list(zip(starts.tolist(), ends.tolist(), texts[keep].tolist()))
+        except Exception:
+            # Unusual layout (e.g. missing columns): use the tolerant csv loop
+            pass
+
     import csv
     captions: List[Tuple[float, float, str]] = []
     with open(path, newline="", encoding="utf-8") as f:
@@ -1579,17 +2362,29 @@ def _schedule_non_overlapping(captions: List[Tuple[float, float, str]], min_gap_
     """
     if not captions:
         return []
-    ordered = sorted(captions, key=lambda x: x[0])
-    result: List[Tuple[float, float, str]] = []
-    current = max(0.0, float(ordered[0][0]))
-    for s, e, t in ordered:
-        s = float(s); e = float(e)
-        dur = max(0.4, e - s)
-        start = max(s, current)
-        end = start + dur
-        result.append((start, end, t))
-        current = end + min_gap_s
-    return result
+    starts, durations, texts = _sorted_caption_arrays(captions)
+    starts[0] = max(0.0, starts[0])
+    offsets = _back_to_back_offsets(durations, min_gap_s)
+    # start_i = max(s_i, start_{i-1} + dur_{i-1} + gap) unrolls to a running max
+    new_starts = offsets + np.maximum.accumulate(starts - offsets)
+    return list(zip(new_starts.tolist(), (new_starts + durations).tolist(), texts))
+
+
+def _sorted_caption_arrays(captions):
+    """Split (start, end, text) captions into start-sorted arrays.
+
+    Returns (starts, durations, texts); durations are at least 0.4 s and the sort is stable.
+    """
+    times = np.array([(c[0], c[1]) for c in captions], dtype=np.float64)
+    order = np.argsort(times[:, 0], kind="stable")
+    starts = times[order, 0]
+    durations = np.maximum(0.4, times[order, 1] - starts)
+    return starts, durations, [captions[i][2] for i in order]
+
+
+def _back_to_back_offsets(durations, gap: float):
+    """Offset of each caption from the first when all play back to back with gap between."""
+    return np.concatenate(([0.0], np.cumsum(durations[:-1] + gap)))
 
 
 def narrate_from_captions(input_video: str,
@@ -1597,12 +2392,15 @@ def narrate_from_captions(input_video: str,
                           output_video: str,
                           burn_subtitles: bool = False,
                           allow_time_push: bool = True,
-                          min_gap_s: float = 0.1) -> str:
+                          min_gap_s: float = 0.1,
+                          music_path: str = None,
+                          music_db: float = -20.0) -> str:
     """Generate narration from user-provided (start, end, text) captions as-is.
 
     - Does NOT resequence or change timings (no overlaps are resolved here).
     - Uses gTTS if available to synthesize speech per caption.
     - Muxes narration into the provided video and optionally burns subtitles.
+    - Optionally mixes background music under the narration in the same pass.
     - Returns the output video path.
     """
     schedule = captions
@@ -1615,6 +2413,8 @@ def narrate_from_captions(input_video: str,
         output_video=output_video,
         burn_subtitles=burn_subtitles,
         sequential=False,
+        music_path=music_path,
+        music_db=music_db,
     )
 
 
@@ -1646,8 +2446,5 @@ def narrate_with_bgm(input_video: str,
 
     Returns final output video path.
     """
-    temp = str(Path(".dotmotion_media") / "narrated_temp.mp4")
-    Path(".dotmotion_media").mkdir(parents=True, exist_ok=True)
-    narrated = narrate_from_captions(input_video, captions, temp, burn_subtitles)
-    add_background_music(narrated, music_path, output_video, music_db=music_db)
-    return output_video
+    return narrate_from_captions(input_video, captions, output_video, burn_subtitles,
+                                 music_path=music_path, music_db=music_db)
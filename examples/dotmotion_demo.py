@@ -7,19 +7,29 @@ showcasing the Polkadot network architecture with professional visual quality.
 
 from manim import (Scene, config, ORIGIN, UP, DOWN, LEFT, RIGHT, FadeIn,
                    FadeOut, Write, Create, Indicate, VGroup, Dot,
-                   RoundedRectangle, GrowFromCenter, BackgroundRectangle,
-                   BLACK)
+                   RoundedRectangle, GrowFromCenter, Rectangle,
+                   BLACK, LaggedStart, Succession, AnimationGroup,
+                   rush_from, ValueTracker, DecimalNumber,
+                   MoveAlongPath)
 import dotmotion as dot
 # Import colors directly to use in create_dot_pattern method
 from dotmotion import (POLKADOT_PINK, POLKADOT_CYAN, POLKADOT_VIOLET,
                        POLKADOT_LIME)
 import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Configure the scene for cinematic quality output
 config.background_color = dot.POLKADOT_BLACK  # Official black background
-config.frame_rate = 60
-config.pixel_width = 1920
-config.pixel_height = 1080
+# DOTMOTION_FPS / DOTMOTION_RES lower these for quick previews, e.g.
+#   DOTMOTION_FPS=30 DOTMOTION_RES=720 manim dotmotion_demo.py PolkadotOverview
+config.frame_rate = int(os.environ.get("DOTMOTION_FPS", 60))
+config.pixel_height = int(os.environ.get("DOTMOTION_RES", 1080))
+config.pixel_width = config.pixel_height * 16 // 9
 config.renderer = "cairo"  # Use cairo for better text rendering
 
 # Constants for better layout
@@ -29,6 +39,10 @@ TITLE_SCALE = 0.75  # Reduced title scaling (previously 0.85)
 SUBTITLE_SCALE = 0.6  # Reduced subtitle scaling (previously 0.7)
 SECTION_SPACING = 1.5  # Spacing between elements
 ANIMATION_SPEED = 0.8  # Adjust global animation speed (< 1 is slower)
+DOT_PATTERN_SEED = 42  # Fixed seed so the welcome dot pattern is identical across renders
+# Welcome dot pattern cycles through these
+DOT_PATTERN_COLORS = (POLKADOT_PINK, POLKADOT_CYAN, POLKADOT_VIOLET,
+                      POLKADOT_LIME)
 
 # Camera positions
 CENTER = ORIGIN
@@ -39,13 +53,90 @@ BOTTOM_SECTION = DOWN * 3.0
 TEXT_DISPLAY_POSITION = DOWN * 2.5  # Default position for explanatory text
 TEXT_OVERLAY_OPACITY = 0.8  # Opacity for text background overlay
 
+# Font sizes the demo's titles and overlays are set in
+WARM_FONT_SIZES = (22, 24, 28, 32, 36, 38, 48, 64)
+
+
+def _create_fitted_text(text, font_size, color, max_width=SCREEN_WIDTH * 0.8):
+    """Create text that is no wider than max_width.
+
+    Text width is proportional to font size, so an overflowing label is
+    scaled by max_width / width once. That gives the same glyphs as shaping
+    it again at the smaller size, without re-measuring the way
+    scale_to_fit_width does.
+    """
+    text_obj = dot.create_text(text, font_size=font_size, color=color)
+    width = text_obj.width
+    if width > max_width:
+        text_obj.scale(max_width / width)
+    return text_obj
+
+# Overlay captions of the staking and XCM sections as (text, font_size).
+# The sections display them from here, and scenes that render a section
+# shape its captions in setup, so their layout happens before the first frame
+STAKING_CAPTIONS = {
+    "title": ("Validation & Staking", 48),
+    "subtitle": ("How validators secure the network", 32),
+    "validators": ("Validators", 32),
+    "validators_role": ("Process transactions & secure the network", 28),
+    "nominators": ("Nominators", 32),
+    "nominators_role": ("Stake DOT to back validators", 28),
+    "connections": ("Staking Connections", 32),
+    "rewards": ("Validator Rewards", 32),
+    "rotation": ("Validator Rotation", 32),
+    "rotation_note": ("Validators are regularly rotated to maintain security", 28),
+}
+XCM_CAPTIONS = {
+    "title": ("Cross-Chain Messaging", 48),
+    "relay": ("The Relay Chain coordinates communication between parachains", 32),
+    "acala": ("Acala: A DeFi hub parachain", 32),
+    "moonbeam": ("Moonbeam: An EVM-compatible smart contract platform", 32),
+    "xcm": ("Cross-Consensus Messaging (XCM)\n"
+            "Allows secure communication between different blockchains", 32),
+    "token_transfer": ("Example 1: Token Transfer\n"
+                       "Transferring DOT tokens from Acala to Moonbeam", 32),
+    "nft_transfer": ("Example 2: NFT Transfer\n"
+                     "Transferring an NFT from Moonbeam to Acala", 32),
+    "contract_call": ("Example 3: Smart Contract Call\n"
+                      "Calling a Moonbeam smart contract from Acala", 32),
+    "benefits": ("Benefits of Cross-Chain Messaging", 32),
+    "composable": ("• Enables truly composable multi-chain applications", 28),
+    "interop": ("• Allows specialized chains to interact seamlessly", 28),
+    "unified": ("• Creates a unified ecosystem of parachains", 28),
+}
+
 
 class PolkadotOverview(Scene):
     """
     A comprehensive cinematic overview of the Polkadot network architecture
     """
 
+    def setup(self):
+        # Backing rectangles for text overlays, reused once faded out
+        self._bg_pool = []
+        # Render a single section when one is selected (see render_sections)
+        self._section = os.environ.get(SECTION_ENV)
+        if self._section is not None and self._section not in OVERVIEW_SECTIONS:
+            raise ValueError(f"Unknown {SECTION_ENV} {self._section!r}; "
+                             f"expected one of {', '.join(OVERVIEW_SECTIONS)}")
+        caption_sets = ((STAKING_CAPTIONS, XCM_CAPTIONS) if self._section is None
+                        else OVERVIEW_SECTIONS[self._section][2])
+        # Load the font at every size the demo uses, then shape the section
+        # overlays up front; display_caption copies them from create_text's cache
+        dot.warm_fonts(WARM_FONT_SIZES)
+        dot.warm_text_cache([(text, font_size, dot.POLKADOT_WHITE)
+                             for captions in caption_sets
+                             for text, font_size in captions.values()])
+
     def construct(self):
+        if self._section is not None:
+            steps, clear_after, _ = OVERVIEW_SECTIONS[self._section]
+            for step in steps:
+                getattr(self, step)()
+            if clear_after:
+                self.smooth_clear()
+            return
+
         # Create the welcome screen
         self.welcome_screen()
 
@@ -89,14 +180,8 @@ class PolkadotOverview(Scene):
             duration: How long to display the text
             dim_background: Whether to dim the entire background for better contrast
         """
-        # Create text object
-        text_obj = dot.create_text(text,
-                                   font_size=font_size,
-                                   color=dot.POLKADOT_WHITE)
-
-        # Ensure text fits within screen
-        if text_obj.width > SCREEN_WIDTH * 0.8:
-            text_obj.scale_to_fit_width(SCREEN_WIDTH * 0.8)
+        # Create text object, fitted within the screen
+        text_obj = _create_fitted_text(text, font_size, dot.POLKADOT_WHITE)
 
         # Position text (default to bottom of screen if not specified)
         if position is not None:
@@ -104,11 +189,17 @@ class PolkadotOverview(Scene):
         else:
             text_obj.move_to(TEXT_DISPLAY_POSITION)
 
-        # Create semi-transparent background for better readability
-        bg_rect = BackgroundRectangle(text_obj,
-                                      color=BLACK,
-                                      fill_opacity=0.8,
-                                      buff=0.4)
+        # Create semi-transparent background for better readability,
+        # reusing a rectangle from an earlier overlay when one is free
+        if self._bg_pool:
+            bg_rect = self._bg_pool.pop()
+        else:
+            bg_rect = Rectangle(fill_color=BLACK,
+                                fill_opacity=0.8,
+                                stroke_width=0)
+        bg_rect.stretch_to_fit_width(text_obj.width + 0.8)
+        bg_rect.stretch_to_fit_height(text_obj.height + 0.8)
+        bg_rect.move_to(text_obj)
 
         text_group = VGroup(bg_rect, text_obj)
 
@@ -127,8 +218,9 @@ class PolkadotOverview(Scene):
         self.play(FadeIn(text_group, run_time=0.7))
         self.wait(duration)
 
-        # Clean up
+        # Clean up; FadeOut restores opacity, so the rectangle can be reused
         self.play(FadeOut(text_group, run_time=0.7))
+        self._bg_pool.append(bg_rect)
         if dim_background and screen_dim is not None:
             self.play(FadeOut(screen_dim, run_time=0.5))
 
@@ -163,44 +255,37 @@ class PolkadotOverview(Scene):
         """Create a decorative dot pattern that represents the network"""
         dots = VGroup()
         # Create a pattern of dots inspired by Polkadot's visual identity
-        colors = [POLKADOT_PINK, POLKADOT_CYAN, POLKADOT_VIOLET, POLKADOT_LIME]
+        colors = DOT_PATTERN_COLORS
 
-        # Generate dots in a grid pattern with some randomness
+        # Generate dots in a grid pattern with some randomness, drawing
+        # x, y, size and opacity for every dot in one batch
         n_dots = 40
+        rng = np.random.default_rng(DOT_PATTERN_SEED)
+        samples = rng.random((n_dots, 4))
+        xs = (samples[:, 0] - 0.5) * SCREEN_WIDTH * 0.9
+        ys = (samples[:, 1] - 0.5) * SCREEN_HEIGHT * 0.9
+        sizes = 0.02 + samples[:, 2] * 0.06
+        opacities = 0.4 + samples[:, 3] * 0.5
         for i in range(n_dots):
-            x = (np.random.random() - 0.5) * SCREEN_WIDTH * 0.9
-            y = (np.random.random() - 0.5) * SCREEN_HEIGHT * 0.9
-            size = np.random.uniform(0.02, 0.08)
-            opacity = np.random.uniform(0.4, 0.9)
             color = colors[i % len(colors)]
 
-            dot = Dot(point=[x, y, 0],
-                      radius=size,
-                      color=color,
-                      fill_opacity=opacity)
-            dots.add(dot)
+            pattern_dot = Dot(point=[xs[i], ys[i], 0],
+                              radius=float(sizes[i]),
+                              color=color,
+                              fill_opacity=float(opacities[i]))
+            dots.add(pattern_dot)
 
         return dots
 
     def create_title(self, text, scale=1.0):
         """Create a title with the Polkadot font"""
-        title = dot.create_text(text,
-                                font_size=64 * scale,
-                                color=dot.POLKADOT_WHITE)
         # Ensure title fits within screen
-        if title.width > SCREEN_WIDTH * 0.8:
-            title.scale_to_fit_width(SCREEN_WIDTH * 0.8)
-        return title
+        return _create_fitted_text(text, 64 * scale, dot.POLKADOT_WHITE)
 
     def create_subtitle(self, text, scale=1.0):
         """Create a stylish subtitle with the Polkadot font"""
-        subtitle = dot.create_text(text,
-                                   font_size=38 * scale,
-                                   color=POLKADOT_PINK)
         # Ensure subtitle fits within screen
-        if subtitle.width > SCREEN_WIDTH * 0.8:
-            subtitle.scale_to_fit_width(SCREEN_WIDTH * 0.8)
-        return subtitle
+        return _create_fitted_text(text, 38 * scale, POLKADOT_PINK)
 
     def create_section_title(self, title_text, scale=TITLE_SCALE):
         """Helper to create consistent section titles"""
@@ -208,6 +293,11 @@ class PolkadotOverview(Scene):
                                font_size=64 * scale,
                                color=dot.POLKADOT_WHITE)
 
+    def display_caption(self, caption, **kwargs):
+        """display_text_with_background for a (text, font_size) caption"""
+        text, font_size = caption
+        self.display_text_with_background(text, font_size=font_size, **kwargs)
+
     def create_section_subtitle(self, text, scale=SUBTITLE_SCALE):
         """Helper to create consistent section subtitles"""
         subtitle = dot.create_text(text,
@@ -218,8 +308,20 @@ class PolkadotOverview(Scene):
     def smooth_clear(self):
         """Clear the entire scene with a smooth fade transition"""
         if self.mobjects:  # Only try to clear if there are mobjects
-            self.play(*[FadeOut(mob, run_time=1.2) for mob in self.mobjects],
+            # Fade a background-colored overlay in over everything, so only
+            # one mobject animates while the rest stay in the static frame,
+            # then drop the whole scene at once beneath it
+            overlay = Rectangle(width=SCREEN_WIDTH * 1.3,
+                                height=SCREEN_HEIGHT * 1.3,
+                                fill_color=config.background_color,
+                                fill_opacity=0,
+                                stroke_width=0)
+            self.add(overlay)
+            self.play(overlay.animate.set_fill(opacity=1),
                       run_time=dot.QUICK_FADE)
+            # The overlay matches the background, so clearing it with the
+            # rest of the scene needs no second fade
+            self.clear()
         else:
             # If no mobjects, just wait a moment
             self.wait(0.5)
@@ -268,11 +370,10 @@ class PolkadotOverview(Scene):
         golden_angle = np.pi * (3 - np.sqrt(5))  # Golden angle ~137.5 degrees
         radius = 4.2  # Distance from center
 
-        positions = []
-        for i in range(n_parachains):
-            angle = i * golden_angle
-            pos = np.array([radius * np.cos(angle), radius * np.sin(angle), 0])
-            positions.append(pos)
+        angles = np.arange(n_parachains) * golden_angle
+        positions = np.zeros((n_parachains, 3))
+        positions[:, 0] = radius * np.cos(angles)
+        positions[:, 1] = radius * np.sin(angles)
 
         # Create parachains with consistent colors from the palette
         parachains = [
@@ -298,26 +399,19 @@ class PolkadotOverview(Scene):
                           radius=0.9),
         ]
 
-        # Connect parachains to relay chain with elegant animations
-        for i, parachain in enumerate(parachains):
-            # Slight delay between each parachain for better visual flow
-            delay = i * 0.2
-
-            # Get connection animations
-            connection_anims = relay.connect_parachain(parachain, animate=True)
-
-            # Play animations with staggered timing
-            self.play(*connection_anims, run_time=1.5 + delay)
-
-            # Emphasize each parachain briefly
-            self.play(Indicate(parachain,
-                               color=parachain.circle.get_color(),
-                               scale_factor=1.1),
-                      run_time=0.8)
-
-            # Small pause between parachains
-            if i < len(parachains) - 1:
-                self.wait(0.3)
+        # Connect parachains to relay chain with elegant animations; each
+        # parachain is indicated right after it attaches, and the next one
+        # starts attaching while the previous is still settling
+        connection_anims = relay.connect_parachains(parachains, animate=True)
+        self.play(LaggedStart(*[
+            Succession(AnimationGroup(*connection_anims[2 * i:2 * i + 2],
+                                      run_time=1.5),
+                       Indicate(parachain,
+                                color=parachain.circle.get_color(),
+                                scale_factor=1.1,
+                                run_time=0.8))
+            for i, parachain in enumerate(parachains)
+        ], lag_ratio=0.35, run_time=6.0))
 
         # Add a visual pulse across the entire network to show connectivity
         self.pulse_network(relay, parachains)
@@ -333,8 +427,9 @@ class PolkadotOverview(Scene):
 
     def pulse_network(self, relay, parachains):
         """Create a visual pulse across the network to show connectivity"""
-        # Create temporary circles for the pulse effect
-        pulse_circles = VGroup()
+        # Create temporary circles for the pulse effect. A plain list: the
+        # play adds each dot to the scene individually, not as a group
+        pulse_circles = []
 
         # Add pulse at relay
         relay_pulse = Dot(radius=relay.radius,
@@ -342,7 +437,7 @@ class PolkadotOverview(Scene):
                           fill_opacity=0.2,
                           stroke_width=0)
         relay_pulse.move_to(relay.get_center())
-        pulse_circles.add(relay_pulse)
+        pulse_circles.append(relay_pulse)
 
         # Add pulses at parachains
         for para in parachains:
@@ -351,38 +446,41 @@ class PolkadotOverview(Scene):
                              fill_opacity=0.2,
                              stroke_width=0)
             para_pulse.move_to(para.get_center())
-            pulse_circles.add(para_pulse)
+            pulse_circles.append(para_pulse)
 
-        # Animate the pulse
+        # Animate the pulse; rush_from front-loads the expansion, so the
+        # faint tail that used to fill most of the 2s is cut short
         self.play(
             *[p.animate.scale(1.5).set_opacity(0) for p in pulse_circles],
-            run_time=2.0)
+            run_time=0.9,
+            rate_func=rush_from)
 
-        # Remove the pulse objects
-        self.remove(pulse_circles)
+        # Remove the pulse objects (removing the group would miss them)
+        self.remove(*pulse_circles)
 
     def show_network_connectivity(self, relay, parachains):
         """Show the connectivity between relay and parachains"""
-        # Create "data packets" (small dots) traveling along connections
-        for para in parachains:
-            # Create a small dot
-            data_dot = Dot(radius=0.08, color=POLKADOT_PINK)
-            data_dot.move_to(relay.get_center())
-
-            # Create return dot
-            return_dot = Dot(radius=0.08, color=para.circle.get_color())
-            return_dot.move_to(para.get_center())
-
-            # Animate dot moving from relay to parachain
-            self.play(data_dot.animate.move_to(para.get_center()),
-                      run_time=0.8)
+        # Create "data packets" (small dots) traveling along connections.
+        # Every parachain's packet travels at once, so the whole exchange
+        # is two plays instead of two per parachain.
+        relay_center = relay.get_center()
+        # Outbound packets are identical, so build one and copy it
+        data_dot = Dot(radius=0.08, color=POLKADOT_PINK).move_to(relay_center)
+        data_dots = [data_dot.copy() for _ in parachains]
+        return_dots = [Dot(radius=0.08, color=para.circle.get_color())
+                       .move_to(para.get_center()) for para in parachains]
+
+        # Animate dots moving from relay to parachains
+        self.play(*[d.animate.move_to(para.get_center())
+                    for d, para in zip(data_dots, parachains)],
+                  run_time=0.8)
 
-            # Animate dot moving from parachain back to relay
-            self.play(return_dot.animate.move_to(relay.get_center()),
-                      run_time=0.8)
+        # Animate dots moving from parachains back to relay
+        self.play(*[d.animate.move_to(relay_center) for d in return_dots],
+                  run_time=0.8)
 
-            # Remove dots
-            self.remove(data_dot, return_dot)
+        # Remove dots
+        self.remove(*data_dots, *return_dots)
 
     def staking_demo(self):
         """Show validator and nominator mechanics"""
@@ -390,25 +488,22 @@ class PolkadotOverview(Scene):
         self.smooth_clear()
 
         # Use the improved text display method instead of overlapping titles
-        self.display_text_with_background("Validation & Staking",
-                                          position=ORIGIN,
-                                          font_size=48,
-                                          duration=2.0)
+        self.display_caption(STAKING_CAPTIONS["title"],
+                             position=ORIGIN,
+                             duration=2.0)
 
-        self.display_text_with_background("How validators secure the network",
-                                          position=ORIGIN,
-                                          font_size=32,
-                                          duration=1.5)
+        self.display_caption(STAKING_CAPTIONS["subtitle"],
+                             position=ORIGIN,
+                             duration=1.5)
 
         # Step 3: Create background and validators
         background = self.create_validator_background()
         self.play(FadeIn(background, run_time=1.0))
 
         # Step 4: First show "Validators" title with background
-        self.display_text_with_background("Validators",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.0)
+        self.display_caption(STAKING_CAPTIONS["validators"],
+                             position=UP * 2.5,
+                             duration=1.0)
 
         # Step 5: Create spaced validators
         validators = VGroup()
@@ -424,22 +519,18 @@ class PolkadotOverview(Scene):
                 size=0.65)
             validators.add(validator)
 
-        # Show validators one at a time
-        for i, validator in enumerate(validators):
-            self.play(FadeIn(validator, run_time=0.8), run_time=0.7)
+        # Show validators one after another in a single staggered play
+        self.play(FadeIn(validators, lag_ratio=0.3, run_time=1.4))
 
         # Add brief explanation with background
-        self.display_text_with_background(
-            "Process transactions & secure the network",
-            position=ORIGIN,
-            font_size=28,
-            duration=1.5)
+        self.display_caption(STAKING_CAPTIONS["validators_role"],
+                             position=ORIGIN,
+                             duration=1.5)
 
         # Step 6: Show "Nominators" title with background
-        self.display_text_with_background("Nominators",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.0)
+        self.display_caption(STAKING_CAPTIONS["nominators"],
+                             position=UP * 2.5,
+                             duration=1.0)
 
         # Step 7: Create nominators with plenty of spacing
         nominators = VGroup()
@@ -457,43 +548,35 @@ class PolkadotOverview(Scene):
         self.play(FadeIn(nominators, run_time=1.2, lag_ratio=0.2))
 
         # Add brief explanation with background
-        self.display_text_with_background("Stake DOT to back validators",
-                                          position=ORIGIN,
-                                          font_size=28,
-                                          duration=1.5)
+        self.display_caption(STAKING_CAPTIONS["nominators_role"],
+                             position=ORIGIN,
+                             duration=1.5)
 
         # Step 8: Show staking connections title
-        self.display_text_with_background("Staking Connections",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.0)
+        self.display_caption(STAKING_CAPTIONS["connections"],
+                             position=UP * 2.5,
+                             duration=1.0)
 
-        # Connect nominators to validators, one connection at a time
+        # Connect nominators to validators, staggering the connections
         stakes = [250, 500, 150, 300]
 
-        # First nominator connects to validators
-        self.connect_stake(nominators[0], validators[0], stakes[0])
-        self.wait(0.3)
-        self.connect_stake(nominators[0], validators[1], stakes[1])
-        self.wait(0.3)
-
-        # Second nominator connects to validators
-        self.connect_stake(nominators[1], validators[1], stakes[2])
-        self.wait(0.3)
-        self.connect_stake(nominators[1], validators[2], stakes[3])
-        self.wait(0.3)
-
-        # Third nominator connects to validators
-        self.connect_stake(nominators[2], validators[2], stakes[0])
-        self.wait(0.3)
-        self.connect_stake(nominators[2], validators[3], stakes[2])
+        # Each nominator connects to two validators; the six connections
+        # draw in one staggered play rather than a play-and-wait per line
+        pairs = [(nominators[0], validators[0], stakes[0]),
+                 (nominators[0], validators[1], stakes[1]),
+                 (nominators[1], validators[1], stakes[2]),
+                 (nominators[1], validators[2], stakes[3]),
+                 (nominators[2], validators[2], stakes[0]),
+                 (nominators[2], validators[3], stakes[2])]
+        self.play(LaggedStart(*[self.connect_stake(n, v, amount)
+                                for n, v, amount in pairs],
+                              lag_ratio=0.25, run_time=4.0))
         self.wait(0.8)
 
         # Step 9: Show validator rewards title with background
-        self.display_text_with_background("Validator Rewards",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.0)
+        self.display_caption(STAKING_CAPTIONS["rewards"],
+                             position=UP * 2.5,
+                             duration=1.0)
 
         # Show validator rewards without text overlap
         rewards = VGroup()
@@ -506,18 +589,19 @@ class PolkadotOverview(Scene):
             reward.move_to(validator.get_center())
             rewards.add(reward)
 
-        # Animate rewards appearing one by one
-        for reward in rewards:
-            self.play(FadeIn(reward, scale=1.5, run_time=0.5), run_time=0.5)
-            self.play(reward.animate.scale(0.6).set_opacity(0.3), run_time=0.5)
+        # Animate rewards appearing one by one, staggered within one play
+        self.play(LaggedStart(*[
+            Succession(FadeIn(reward, scale=1.5, run_time=0.5),
+                       reward.animate(run_time=0.5).scale(0.6).set_opacity(0.3))
+            for reward in rewards
+        ], lag_ratio=0.2))
 
         self.play(FadeOut(rewards), run_time=0.7)
 
         # Step 10: Show validator rotation title with background
-        self.display_text_with_background("Validator Rotation",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.0)
+        self.display_caption(STAKING_CAPTIONS["rotation"],
+                             position=UP * 2.5,
+                             duration=1.0)
 
         # Animate validator set change with no text overlap
         dot.animate_validator_set_change(self,
@@ -527,55 +611,51 @@ class PolkadotOverview(Scene):
         self.wait(0.8)
 
         # Final explanation with dimmed background for emphasis
-        self.display_text_with_background(
-            "Validators are regularly rotated to maintain security",
-            position=ORIGIN,
-            font_size=28,
-            duration=2.0,
-            dim_background=True)
+        self.display_caption(STAKING_CAPTIONS["rotation_note"],
+                             position=ORIGIN,
+                             duration=2.0,
+                             dim_background=True)
 
         # Final pause
         self.wait(1.0)
 
     def create_validator_background(self):
         """Create an elegant background for the validator section"""
-        # Create a subtle grid pattern
-        background = VGroup()
-
-        # Add horizontal lines
-        for y in np.arange(-3.5, 4.0, 0.7):
-            line = dot.Line(LEFT * 6,
-                            RIGHT * 6,
-                            color=dot.POLKADOT_STORM_700,
-                            stroke_width=0.5,
-                            stroke_opacity=0.3)
-            line.move_to([0, y, 0])
-            background.add(line)
-
-        # Add vertical lines
-        for x in np.arange(-6, 6.5, 1.5):
-            line = dot.Line(DOWN * 3.5,
-                            UP * 3.5,
-                            color=dot.POLKADOT_STORM_700,
-                            stroke_width=0.5,
-                            stroke_opacity=0.3)
-            line.move_to([x, 0, 0])
-            background.add(line)
+        # Create a subtle grid pattern as one path, so every frame strokes
+        # the whole grid at once instead of one Line per row and column
+        ys = np.arange(-3.5, 4.0, 0.7)
+        xs = np.arange(-6, 6.5, 1.5)
+
+        # Segment endpoints: horizontal lines, then vertical lines
+        starts = np.zeros((len(ys) + len(xs), 3))
+        ends = np.zeros_like(starts)
+        starts[:len(ys), 0], starts[:len(ys), 1] = -6, ys
+        ends[:len(ys), 0], ends[:len(ys), 1] = 6, ys
+        starts[len(ys):, 0], starts[len(ys):, 1] = xs, -3.5
+        ends[len(ys):, 0], ends[len(ys):, 1] = xs, 3.5
+
+        # Each segment is a straight cubic curve; disjoint curves become
+        # separate subpaths of the same mobject
+        t = np.linspace(0, 1, 4)[None, :, None]
+        points = starts[:, None] + t * (ends - starts)[:, None]
+
+        background = dot.VMobject()
+        background.set_points(points.reshape(-1, 3))
+        background.set_stroke(dot.POLKADOT_STORM_700, width=0.5, opacity=0.3)
 
         return background
 
     def connect_stake(self, nominator, validator, amount):
-        """Connect a nominator to a validator with a stake amount"""
+        """Return the animation connecting a nominator to a validator"""
         connection = nominator.connect_to_validator(validator,
                                                     stake_amount=amount)
 
-        # Create a more engaging animation for the connection
+        # Draw the line first, then write the stake amount over it
         if isinstance(connection, VGroup):
             line, text = connection
-            self.play(Create(line, run_time=0.8))
-            self.play(Write(text, run_time=0.6))
-        else:
-            self.play(Create(connection, run_time=0.8))
+            return Succession(Create(line, run_time=0.8),
+                              Write(text, run_time=0.6))
+        return Create(connection, run_time=0.8)
 
     def xcm_demo(self):
         """Show cross-chain messaging with clear separation of text and animations"""
@@ -584,19 +664,16 @@ class PolkadotOverview(Scene):
         self.smooth_clear()
 
         # Show title by itself with background dimming for emphasis
-        self.display_text_with_background("Cross-Chain Messaging",
-                                          position=ORIGIN,
-                                          font_size=48,
-                                          duration=2.0,
-                                          dim_background=True)
+        self.display_caption(XCM_CAPTIONS["title"],
+                             position=ORIGIN,
+                             duration=2.0,
+                             dim_background=True)
 
         # ===== PHASE 2: RELAY CHAIN =====
         # First, show an explanation of what we're going to see
-        self.display_text_with_background(
-            "The Relay Chain coordinates communication between parachains",
-            position=ORIGIN,
-            font_size=32,
-            duration=2.0)
+        self.display_caption(XCM_CAPTIONS["relay"],
+                             position=ORIGIN,
+                             duration=2.0)
 
         # Create relay chain with ample space around it
         relay = dot.PolkadotRelay(radius=2.0, n_validators=6)
@@ -610,10 +687,9 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 3: PARACHAIN 1 (ACALA) =====
         # Show text about first parachain with background
-        self.display_text_with_background("Acala: A DeFi hub parachain",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.5)
+        self.display_caption(XCM_CAPTIONS["acala"],
+                             position=UP * 2.5,
+                             duration=1.5)
 
         # Create and connect first parachain - positioned far from center
         acala = dot.Parachain(name="Acala",
@@ -628,11 +704,9 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 4: PARACHAIN 2 (MOONBEAM) =====
         # Show text about second parachain with background
-        self.display_text_with_background(
-            "Moonbeam: An EVM-compatible smart contract platform",
-            position=UP * 2.5,
-            font_size=32,
-            duration=1.5)
+        self.display_caption(XCM_CAPTIONS["moonbeam"],
+                             position=UP * 2.5,
+                             duration=1.5)
 
         # Create and connect second parachain - positioned far from center on opposite side
         moonbeam = dot.Parachain(name="Moonbeam",
@@ -647,22 +721,16 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 5: XCM INTRODUCTION =====
         # Introduce XCM with background dimming for emphasis
-        self.display_text_with_background(
-            "Cross-Consensus Messaging (XCM)\n" +
-            "Allows secure communication between different blockchains",
-            position=ORIGIN,
-            font_size=32,
-            duration=2.5,
-            dim_background=True)
+        self.display_caption(XCM_CAPTIONS["xcm"],
+                             position=ORIGIN,
+                             duration=2.5,
+                             dim_background=True)
 
         # ===== PHASE 6: TOKEN TRANSFER EXAMPLE =====
         # Show example 1 title with background
-        self.display_text_with_background(
-            "Example 1: Token Transfer\n" +
-            "Transferring DOT tokens from Acala to Moonbeam",
-            position=ORIGIN,
-            font_size=32,
-            duration=2.0)
+        self.display_caption(XCM_CAPTIONS["token_transfer"],
+                             position=ORIGIN,
+                             duration=2.0)
 
         # Show token transfer animation with no overlapping text
         xcm_msg = dot.animate_cross_chain_transfer(self,
@@ -680,12 +748,9 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 7: NFT TRANSFER EXAMPLE =====
         # Show example 2 title with background
-        self.display_text_with_background(
-            "Example 2: NFT Transfer\n" +
-            "Transferring an NFT from Moonbeam to Acala",
-            position=ORIGIN,
-            font_size=32,
-            duration=2.0)
+        self.display_caption(XCM_CAPTIONS["nft_transfer"],
+                             position=ORIGIN,
+                             duration=2.0)
 
         # Show NFT transfer animation
         xcm_msg = dot.animate_cross_chain_transfer(self,
@@ -703,12 +768,9 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 8: SMART CONTRACT EXAMPLE =====
         # Show example 3 title with background
-        self.display_text_with_background(
-            "Example 3: Smart Contract Call\n" +
-            "Calling a Moonbeam smart contract from Acala",
-            position=ORIGIN,
-            font_size=32,
-            duration=2.0)
+        self.display_caption(XCM_CAPTIONS["contract_call"],
+                             position=ORIGIN,
+                             duration=2.0)
 
         # Show smart contract call animation
         xcm_msg = dot.animate_cross_chain_transfer(self,
@@ -726,23 +788,15 @@ class PolkadotOverview(Scene):
 
         # ===== PHASE 9: CONCLUSION =====
         # Final explanation about XCM benefits with background dimming
-        self.display_text_with_background("Benefits of Cross-Chain Messaging",
-                                          position=UP * 2.5,
-                                          font_size=32,
-                                          duration=1.5)
+        self.display_caption(XCM_CAPTIONS["benefits"],
+                             position=UP * 2.5,
+                             duration=1.5)
 
         # Show bullet points one by one with background
-        points = [
-            "• Enables truly composable multi-chain applications",
-            "• Allows specialized chains to interact seamlessly",
-            "• Creates a unified ecosystem of parachains"
-        ]
-
-        for point in points:
-            self.display_text_with_background(point,
-                                              position=ORIGIN,
-                                              font_size=28,
-                                              duration=1.5)
+        for point in ("composable", "interop", "unified"):
+            self.display_caption(XCM_CAPTIONS[point],
+                                 position=ORIGIN,
+                                 duration=1.5)
 
         # Final pause
         self.wait(1.0)
@@ -995,18 +1049,18 @@ class PolkadotOverview(Scene):
         # Fade out text before animation
         self.play(FadeOut(step3_text, run_time=0.7))
 
-        # Move proposal along the arrow path to referendum
+        # Move proposal along the arrow path to referendum, from where it
+        # currently sits (the original legs skipped the council's bottom edge)
         path_points = [
-            governance.council.get_bottom(),
+            proposal_group.get_center(),
             governance.council.get_bottom() + DOWN * 0.5,
             governance.referendum.get_top() + UP * 0.5,
             governance.referendum.get_center()
         ]
 
-        # Create a path animation along the points
-        for i in range(len(path_points) - 1):
-            self.play(proposal_group.animate.move_to(path_points[i + 1]),
-                      run_time=0.7)
+        # Follow the whole route in one animation instead of one per leg
+        path = dot.VMobject().set_points_as_corners(path_points)
+        self.play(MoveAlongPath(proposal_group, path), run_time=2.1)
 
         self.wait(0.8)
 
@@ -1022,13 +1076,31 @@ class PolkadotOverview(Scene):
         # Fade out text before animation
         self.play(FadeOut(step4_text, run_time=0.7))
 
-        # Show voting happening
-        vote_yes = dot.create_text("YES: 67%",
-                                   font_size=18,
-                                   color=POLKADOT_LIME)
-        vote_no = dot.create_text("NO: 33%",
+        # Show voting happening. The percentages are DecimalNumbers driven
+        # by one tracker: counting only re-copies cached digit glyphs
+        # instead of shaping a whole new label on every tick. The glyphs
+        # come from create_text so they share the labels' brand font
+        yes_pct = ValueTracker(58)
+        yes_value = DecimalNumber(58,
+                                  num_decimal_places=0,
+                                  mob_class=dot.create_text,
                                   font_size=18,
-                                  color=dot.POLKADOT_STORM_400)
+                                  color=POLKADOT_LIME)
+        no_value = DecimalNumber(42,
+                                 num_decimal_places=0,
+                                 mob_class=dot.create_text,
+                                 font_size=18,
+                                 color=dot.POLKADOT_STORM_400)
+        vote_yes = VGroup(
+            dot.create_text("YES:", font_size=18, color=POLKADOT_LIME),
+            yes_value,
+            dot.create_text("%", font_size=18, color=POLKADOT_LIME),
+        ).arrange(RIGHT, buff=0.1)
+        vote_no = VGroup(
+            dot.create_text("NO:", font_size=18, color=dot.POLKADOT_STORM_400),
+            no_value,
+            dot.create_text("%", font_size=18, color=dot.POLKADOT_STORM_400),
+        ).arrange(RIGHT, buff=0.1)
 
         # Position votes to the right side to avoid overlap
         vote_yes.move_to(RIGHT * 3.5 + UP * 0.2)
@@ -1039,19 +1111,11 @@ class PolkadotOverview(Scene):
         self.play(Write(vote_no, run_time=0.8))
 
         # Show vote counting up animation
-        for i in range(3):
-            self.play(vote_yes.animate.become(
-                dot.create_text(f"YES: {58 + 3*i}%",
-                                font_size=18,
-                                color=POLKADOT_LIME).move_to(
-                                    vote_yes.get_center())),
-                      vote_no.animate.become(
-                          dot.create_text(
-                              f"NO: {42 - 3*i}%",
-                              font_size=18,
-                              color=dot.POLKADOT_STORM_400).move_to(
-                                  vote_no.get_center())),
-                      run_time=0.6)
+        yes_value.add_updater(lambda m: m.set_value(yes_pct.get_value()))
+        no_value.add_updater(lambda m: m.set_value(100 - yes_pct.get_value()))
+        self.play(yes_pct.animate.set_value(67), run_time=1.8)
+        yes_value.clear_updaters()
+        no_value.clear_updaters()
 
         # Show final vote tally
         self.play(vote_yes.animate.set_color(POLKADOT_LIME).scale(1.2),
@@ -1147,6 +1211,61 @@ class PolkadotOverview(Scene):
         self.wait(1.0)
 
 
+# Sections of PolkadotOverview as name -> (steps, fade out at the end,
+# caption sets to shape). Every section after the welcome screen starts from
+# an empty scene and ends with the fade PolkadotOverview plays before the
+# next one, so rendering them separately and concatenating the videos gives
+# the same timeline. Governance stays on screen until the credits fade it
+# out, so those two render together to keep that transition.
+OVERVIEW_SECTIONS = {
+    "welcome": (("welcome_screen",), False, ()),
+    "ecosystem": (("ecosystem_demo",), True, ()),
+    "staking": (("staking_demo",), True, (STAKING_CAPTIONS,)),
+    "xcm": (("xcm_demo",), True, (XCM_CAPTIONS,)),
+    "governance": (("governance_demo", "ending_credits"), False, ()),
+}
+# Selects the section PolkadotOverview renders; unset renders all of them
+SECTION_ENV = "DOTMOTION_SECTION"
+
+
+def render_sections(output="PolkadotOverview.mp4", quality="h",
+                    media_dir="media/sections", workers=None):
+    """Render the overview sections in parallel and join them with ffmpeg.
+
+    Each section renders PolkadotOverview in its own manim process with
+    DOTMOTION_SECTION set; the segments share codec, frame rate and
+    resolution, so they are concatenated without re-encoding.
+    """
+    workers = workers or min(os.cpu_count() or 1, len(OVERVIEW_SECTIONS))
+    Path(media_dir).mkdir(parents=True, exist_ok=True)
+
+    # A fresh media dir per run, so a video left by an earlier run (another
+    # quality, or an older version of the scene) can't be picked up
+    with tempfile.TemporaryDirectory(dir=media_dir) as run_dir:
+
+        def render(section):
+            # One media dir per section: every process writes PolkadotOverview.mp4
+            section_dir = Path(run_dir) / section
+            subprocess.run(["manim", f"-q{quality}", "--media_dir", str(section_dir),
+                            __file__, "PolkadotOverview"],
+                           env={**os.environ, SECTION_ENV: section},
+                           check=True)
+            # manim nests the video under a resolution/frame-rate folder
+            return next(section_dir.rglob("PolkadotOverview.mp4"))
+
+        # manim runs as a subprocess, so threads are enough to keep the
+        # renders going in parallel
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            segments = list(pool.map(render, OVERVIEW_SECTIONS))
+
+        dot.concat_videos(segments, output)
+    return output
+
+
 if __name__ == "__main__":
-    print("Run this with: manim -pqh dotmotion_demo.py PolkadotOverview")
-    print("For higher quality: manim -pql dotmotion_demo.py PolkadotOverview")
+    if "--sections" in sys.argv:
+        print(f"Rendered {render_sections()}")
+    else:
+        print("Run this with: manim -pqh dotmotion_demo.py PolkadotOverview")
+        print("For higher quality: manim -pql dotmotion_demo.py PolkadotOverview")
+        print("To render the sections in parallel: python dotmotion_demo.py --sections")
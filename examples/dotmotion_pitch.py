@@ -1,13 +1,33 @@
 from manim import (Scene, VGroup, ORIGIN, UP, DOWN, LEFT, RIGHT, FadeIn, FadeOut,
-                   Write, Create, Indicate, config, RoundedRectangle)
+                   Write, Create, Indicate, config, RoundedRectangle,
+                   AnimationGroup, Succession, Rectangle)
+import os
+from pathlib import Path
+import numpy as np
 import dotmotion as dot
 
 
 class DotmotionPitch(Scene):
-    """90s pitch video: problem -> solution -> features -> credibility -> CTA."""
+    """90s pitch video: problem -> solution -> features -> credibility -> CTA.
+
+    Set DOTMOTION_CAPTIONS=1 to also save the on-screen captions as
+    captions_from_clock.json next to the rendered video.
+    """
+
+    capture_captions = os.environ.get("DOTMOTION_CAPTIONS") == "1"
+    # Seed for the Markov matrix, so renders (and captured captions) match
+    markov_seed = 42
+
+    def captions_path(self):
+        """Where captured captions are written: beside the movie file."""
+        movie = getattr(self.renderer.file_writer, "movie_file_path", None)
+        folder = Path(movie).parent if movie else Path(config.media_dir)
+        return folder / "captions_from_clock.json"
 
     def construct(self):
         config.background_color = dot.POLKADOT_BLACK
+        if self.capture_captions:
+            dot.PlaybackClock.install(self, str(self.captions_path()))
 
         # Title card
         title = dot.create_text("Dotmotion", font_size=64)
@@ -49,10 +69,9 @@ class DotmotionPitch(Scene):
         self.play(Create(relay.ring, run_time=1.2))
         self.play(Write(relay.name, run_time=0.6), FadeIn(relay.validators, run_time=0.9, lag_ratio=0.1))
         # Parachains from registry
-        reg = dot.load_chain_registry()
-        mythos_name, _, mythos_color = dot.get_chain_theme("mythos", reg) or ("Mythos", None, dot.ACALA_COLOR)
-        moonbeam_name, _, moonbeam_color = dot.get_chain_theme("moonbeam", reg) or ("Moonbeam", None, dot.MOONBEAM_COLOR)
-        hydration_name, _, hydration_color = dot.get_chain_theme("hydration", reg) or ("Hydration", None, dot.ASTAR_COLOR)
+        mythos_name, _, mythos_color = dot.get_chain_theme("mythos") or ("Mythos", None, dot.ACALA_COLOR)
+        moonbeam_name, _, moonbeam_color = dot.get_chain_theme("moonbeam") or ("Moonbeam", None, dot.MOONBEAM_COLOR)
+        hydration_name, _, hydration_color = dot.get_chain_theme("hydration") or ("Hydration", None, dot.ASTAR_COLOR)
         paras = [
             dot.Parachain(name=mythos_name, position=LEFT * 4.4 + UP * 1.2, color=mythos_color, radius=0.85),
             dot.Parachain(name=moonbeam_name, position=RIGHT * 4.4 + DOWN * 0.8, color=moonbeam_color, radius=0.85),
@@ -82,7 +101,7 @@ class DotmotionPitch(Scene):
 
         # Hide relay visuals to avoid overlap during math interlude
         if hasattr(relay, "connection_lines") and relay.connection_lines:
-            self.play(*[FadeOut(l, run_time=0.25) for l in relay.connection_lines])
+            self.play(FadeOut(VGroup(*relay.connection_lines), run_time=0.25))
         self.play(FadeOut(logo), *[FadeOut(p) for p in paras], FadeOut(relay), run_time=0.5)
 
         # Tokenomics intro (no overlap with relay visuals)
@@ -91,7 +110,7 @@ class DotmotionPitch(Scene):
                                 position="center", font_size=30, bg=True, margin=0.4, wait_time=1.0)
 
         # Mathematical interlude: tokenomics curves (fallback if MathTex not available)
-        from manim import Axes, ValueTracker, always_redraw, Dot as MDot
+        from manim import Axes, ValueTracker, Dot as MDot
         axes = Axes(x_range=[0, 10, 1], y_range=[0, 1, 0.2], x_length=6, y_length=3)
         axes.move_to(ORIGIN + UP * 1.6)
         self.play(Create(axes), run_time=0.6)
@@ -100,8 +119,7 @@ class DotmotionPitch(Scene):
         formula_group = None
         latex_ok = True
         try:
-            from manim import MathTex
-            formula = MathTex(r"I(t) = I_0 e^{-k t} \quad\text{(inflation)}")
+            formula = dot.cached_mathtex(r"I(t) = I_0 e^{-k t} \quad\text{(inflation)}")
             formula.scale(0.7)
             formula.to_edge(UP, buff=0.6)
             formula_group = formula
@@ -114,35 +132,73 @@ class DotmotionPitch(Scene):
         import math
         k = ValueTracker(0.25)
         I0 = 1.0
-        infl_curve = axes.plot(lambda x: I0 * math.exp(-k.get_value() * x), color=dot.POLKADOT_PINK)
+
+        def inflation(x):
+            # Works on whole sample arrays, so the curves are plotted with
+            # one np.exp call instead of one Python call per sample
+            return I0 * np.exp(-k.get_value() * x)
+
+        infl_curve = axes.plot(inflation, color=dot.POLKADOT_PINK, use_vectorized=True)
         self.play(Create(infl_curve), run_time=0.8)
         # moving point on curve at x=t
         t = ValueTracker(0.0)
-        moving = always_redraw(lambda: MDot(axes.coords_to_point(t.get_value(), I0 * math.exp(-k.get_value() * t.get_value())), radius=0.06, color=dot.POLKADOT_LIME))
+        # One dot moved by an updater rather than rebuilt every frame
+        moving = MDot(axes.coords_to_point(0, I0), radius=0.06, color=dot.POLKADOT_LIME)
+        moving.add_updater(lambda m: m.move_to(axes.coords_to_point(t.get_value(), I0 * math.exp(-k.get_value() * t.get_value()))))
         self.add(moving)
         self.play(t.animate.set_value(10), run_time=1.6)
-        # Animate parameter change to show different inflation regimes
-        self.play(k.animate.set_value(0.65), run_time=1.2)
-        # Update curve by replacing with new sampled function
-        new_curve = axes.plot(lambda x: I0 * math.exp(-k.get_value() * x), color=dot.POLKADOT_PINK)
-        self.play(infl_curve.animate.become(new_curve), run_time=0.8)
+        # Animate parameter change to show different inflation regimes. Both
+        # regimes are plotted once; while k changes the curve blends between
+        # them (cheap point interpolation, no re-plot per frame), weighted so
+        # its end stays under the dot at x = t. Same 2.0 s as the old k change
+        # plus morph, so later captions keep their timing
+        k_start, k_end = k.get_value(), 0.65
+        start_curve = infl_curve.copy()
+        end_curve = axes.plot(lambda x: I0 * np.exp(-k_end * x), color=dot.POLKADOT_PINK, use_vectorized=True)
+        x_end = t.get_value()
+        y_start, y_end = math.exp(-k_start * x_end), math.exp(-k_end * x_end)
+        infl_curve.add_updater(lambda m: m.interpolate(
+            start_curve, end_curve, (y_start - math.exp(-k.get_value() * x_end)) / (y_start - y_end)))
+        self.play(k.animate.set_value(k_end), run_time=2.0)
+        infl_curve.clear_updaters()
+        moving.clear_updaters()
         self.play(FadeOut(moving), FadeOut(infl_curve), FadeOut(formula_group), FadeOut(axes), run_time=0.5)
 
         # Matrix adjacency-like grid animation
         from manim import VGroup as MGroup
         # Matrix section: heatmap A and vector v, show A·v -> v' (Markov step)
-        import random
         size = 5
-        A = [[round(random.uniform(0.0, 1.0), 2) for _ in range(size)] for _ in range(size)]
-        # normalize rows to sum to 1 for Markov-like interpretation
-        for i in range(size):
-            s = sum(A[i]) or 1.0
-            A[i] = [a / s for a in A[i]]
-        v = [1.0 / size] * size
-
-        def color_for_value(x):
-            # map 0..1 to storm->cyan
-            return dot.POLKADOT_STORM_700 if x < 0.25 else (dot.POLKADOT_STORM_400 if x < 0.5 else (dot.POLKADOT_PINK if x < 0.75 else dot.POLKADOT_CYAN))
+        # Weights drawn to two decimals as before, then rows normalized to
+        # sum to 1 for Markov-like interpretation
+        A_np = dot.row_stochastic(np.random.default_rng(self.markov_seed).random((size, size)).round(2))
+        v_np = np.full(size, 1.0 / size)
+        res_np = A_np @ v_np
+        # Labels formatted in one pass
+        v = v_np.tolist()
+        A_labels = [f"{x:.2f}" for x in A_np.ravel()]
+
+        # map 0..1 to storm->cyan in quarter buckets, looked up once per cell
+        # so the highlight loop only indexes cached lists
+        color_table = (dot.POLKADOT_STORM_700, dot.POLKADOT_STORM_400, dot.POLKADOT_PINK, dot.POLKADOT_CYAN)
+
+        def bucket_colors(values):
+            return [color_table[b] for b in np.minimum((values * 4).astype(int), 3).tolist()]
+
+        A_colors = [bucket_colors(row) for row in A_np]
+        v_colors = bucket_colors(v_np)
+
+        # Every label is "X.XX" inside a 0.5-wide cell, so the font size that
+        # fits one (with padding) fits them all; size it once from a prototype
+        # instead of measuring and rescaling each label
+        proto_width = dot.create_text("0.00", font_size=16).width
+        label_font = 16 * min(1.0, 0.5 * 0.82 / proto_width)
+
+        # All 35 cells share one rounded-rect outline: build its Bezier path
+        # once and copy it, recolouring each copy
+        cell_proto = RoundedRectangle(width=0.5, height=0.5, corner_radius=0.06, stroke_width=1)
+
+        def make_cell(color, fill_opacity):
+            return cell_proto.copy().set_color(color).set_fill(opacity=fill_opacity)
 
         grid = MGroup()
         cell_refs = []
@@ -150,15 +206,9 @@ class DotmotionPitch(Scene):
             row = MGroup()
             row_cells = []
             for j in range(size):
-                val = A[i][j]
-                cell = RoundedRectangle(width=0.5, height=0.5, corner_radius=0.06,
-                                         color=color_for_value(val), fill_opacity=0.35, stroke_width=1)
-                label = dot.create_text(f"{val:.2f}", font_size=16, color=dot.POLKADOT_WHITE)
+                cell = make_cell(A_colors[i][j], 0.35)
+                label = dot.create_text(A_labels[i * size + j], font_size=label_font, color=dot.POLKADOT_WHITE)
                 label.move_to(cell.get_center())
-                # Fit text inside cell with padding
-                max_label_w = cell.width * 0.82
-                if label.width > max_label_w:
-                    label.scale_to_fit_width(max_label_w)
                 g = VGroup(cell, label)
                 row.add(g)
                 row_cells.append(g)
@@ -173,13 +223,9 @@ class DotmotionPitch(Scene):
         vec_cells = []
         for i in range(size):
             val = v[i]
-            r = RoundedRectangle(width=0.5, height=0.5, corner_radius=0.06,
-                                 color=color_for_value(val), fill_opacity=0.35, stroke_width=1)
-            label = dot.create_text(f"{val:.2f}", font_size=16, color=dot.POLKADOT_WHITE)
+            r = make_cell(v_colors[i], 0.35)
+            label = dot.create_text(f"{val:.2f}", font_size=label_font, color=dot.POLKADOT_WHITE)
             label.move_to(r.get_center())
-            max_label_w = r.width * 0.82
-            if label.width > max_label_w:
-                label.scale_to_fit_width(max_label_w)
             g = VGroup(r, label)
             vec.add(g)
             vec_cells.append(g)
@@ -190,13 +236,9 @@ class DotmotionPitch(Scene):
         res = MGroup()
         res_cells = []
         for i in range(size):
-            r = RoundedRectangle(width=0.5, height=0.5, corner_radius=0.06,
-                                 color=dot.POLKADOT_STORM_700, fill_opacity=0.12, stroke_width=1)
-            label = dot.create_text("0.00", font_size=16, color=dot.POLKADOT_STORM_200)
+            r = make_cell(dot.POLKADOT_STORM_700, 0.12)
+            label = dot.create_text("0.00", font_size=label_font, color=dot.POLKADOT_STORM_200)
             label.move_to(r.get_center())
-            max_label_w = r.width * 0.82
-            if label.width > max_label_w:
-                label.scale_to_fit_width(max_label_w)
             g = VGroup(r, label)
             res.add(g)
             res_cells.append(g)
@@ -204,8 +246,7 @@ class DotmotionPitch(Scene):
         res.next_to(vec, RIGHT, buff=0.7)
 
         # Optional label A v -> v'
-        from manim import MathTex
-        av_lbl = MathTex(r"v' = A\\, v").scale(0.8)
+        av_lbl = dot.cached_mathtex(r"v' = A\\, v").scale(0.8)
         # Ensure the MathTex label stays on one line and within frame
         av_lbl.next_to(grid, UP, buff=0.35)
         max_av_w = grid.width * 1.2
@@ -220,34 +261,33 @@ class DotmotionPitch(Scene):
 
         layout_group = VGroup(grid, vec, res, av_lbl)
         # Slightly reduce to avoid overflow
-        layout_group.scale(1.05)
+        layout_scale = 1.05
+        layout_group.scale(layout_scale)
         layout_group.move_to(ORIGIN)
         self.play(FadeIn(layout_group, run_time=0.6), FadeIn(explain_top, run_time=0.5), FadeIn(explain_bottom, run_time=0.5))
 
-        # Animate multiplication row by row
-        import numpy as np
-        A_np = np.array(A)
-        v_np = np.array(v)
-        res_np = A_np.dot(v_np)
+        # Animate multiplication row by row; each row's highlight, result
+        # and unhighlight steps run back to back inside a single play
         for i in range(size):
-            # highlight row i
-            self.play(*[cell_refs[i][j][0].animate.set_fill(dot.POLKADOT_LIME, opacity=0.45) for j in range(size)], run_time=0.2)
-            # pulse vector
-            self.play(*[vec_cells[j][0].animate.set_fill(dot.POLKADOT_PINK, opacity=0.45) for j in range(size)], run_time=0.2)
-            # set result cell value
             val = float(res_np[i])
-            # Update result label and fit inside the cell
-            new_lbl = dot.create_text(f"{val:.2f}", font_size=16, color=dot.POLKADOT_WHITE)
-            max_label_w = res_cells[i][0].width * 0.82
-            if new_lbl.width > max_label_w:
-                new_lbl.scale_to_fit_width(max_label_w)
+            # Result label for this row; layout_group was scaled after the
+            # cells were built, so scale the new label to match
+            new_lbl = dot.create_text(f"{val:.2f}", font_size=label_font, color=dot.POLKADOT_WHITE)
+            new_lbl.scale(layout_scale)
             new_lbl.move_to(res_cells[i][0].get_center())
-            res_cells[i][1].become(new_lbl)
-            res_cells[i][0].set_fill(dot.POLKADOT_CYAN, opacity=0.45)
-            self.wait(0.15)
-            # unhighlight
-            self.play(*[cell_refs[i][j][0].animate.set_fill(color_for_value(A[i][j]), opacity=0.35) for j in range(size)],
-                      *[vec_cells[j][0].animate.set_fill(color_for_value(v[j]), opacity=0.35) for j in range(size)], run_time=0.2)
+            self.play(Succession(
+                # highlight row i
+                AnimationGroup(*[cell_refs[i][j][0].animate.set_fill(dot.POLKADOT_LIME, opacity=0.45) for j in range(size)], run_time=0.2),
+                # pulse vector
+                AnimationGroup(*[vec_cells[j][0].animate.set_fill(dot.POLKADOT_PINK, opacity=0.45) for j in range(size)], run_time=0.2),
+                # set result cell value
+                AnimationGroup(res_cells[i][1].animate.become(new_lbl),
+                               res_cells[i][0].animate.set_fill(dot.POLKADOT_CYAN, opacity=0.45), run_time=0.15),
+                # unhighlight
+                AnimationGroup(*[cell_refs[i][j][0].animate.set_fill(A_colors[i][j], opacity=0.35) for j in range(size)],
+                               *[vec_cells[j][0].animate.set_fill(v_colors[j], opacity=0.35) for j in range(size)], run_time=0.2),
+            # Sum of the steps, passed explicitly so PlaybackClock counts it
+            ), run_time=0.75)
 
         self.play(FadeOut(layout_group), FadeOut(explain_top), FadeOut(explain_bottom), run_time=0.5)
 
@@ -255,19 +295,20 @@ class DotmotionPitch(Scene):
         self.play(FadeIn(relay), *[FadeIn(p) for p in paras], FadeIn(logo), run_time=0.5)
 
         # XCM highlight
-        dim = dot.RoundedRectangle(width=config.frame_width * 1.1,
-                                   height=config.frame_height * 1.1,
-                                   corner_radius=0.1,
-                                   fill_opacity=0.55,
-                                   stroke_opacity=0,
-                                   color=dot.BLACK)
+        # Plain rectangle: its corners are off-frame, so rounding them only
+        # adds curve segments to every dimmed frame
+        dim = Rectangle(width=config.frame_width * 1.1,
+                        height=config.frame_height * 1.1,
+                        fill_opacity=0.55,
+                        stroke_opacity=0,
+                        color=dot.BLACK)
         self.play(FadeIn(dim, run_time=0.3))
         xcm = dot.animate_xcm(self, paras[0], paras[1], xcm_type="transfer", message="XCM: Transfer", duration=1.7)
         self.play(FadeOut(xcm, run_time=0.25), FadeOut(dim, run_time=0.25))
 
         # Clean before CTA
         if hasattr(relay, "connection_lines") and relay.connection_lines:
-            self.play(*[FadeOut(l, run_time=0.25) for l in relay.connection_lines])
+            self.play(FadeOut(VGroup(*relay.connection_lines), run_time=0.25))
         self.play(FadeOut(logo), *[FadeOut(p) for p in paras], FadeOut(relay), run_time=0.6)
 
         # CTA
@@ -1,13 +1,11 @@
-from manim import *
-import dotmotion as dot
 from dotmotion_pitch import DotmotionPitch
-from pathlib import Path
-import json
+
 
 class DotmotionPitchClock(DotmotionPitch):
-    def construct(self):
-        with dot.PlaybackClock(self) as clock:
-            super().construct()
-        # Save alongside the 480p render folder; manim handles dirs
-        Path('media/videos/dotmotion_pitch/480p15').mkdir(parents=True, exist_ok=True)
-        Path('media/videos/dotmotion_pitch/480p15/captions_from_clock.json').write_text(json.dumps(clock.captions, indent=2), encoding='utf-8')
+    """DotmotionPitch with caption capture always on.
+
+    Equivalent to rendering DotmotionPitch with DOTMOTION_CAPTIONS=1; the
+    captions land in captions_from_clock.json beside this scene's video.
+    """
+
+    capture_captions = True
@@ -1,7 +1,34 @@
 from pathlib import Path
+import hashlib
 import json
+import os
 import dotmotion as dot
 
+# Fallback BGM file names looked up in ~/Downloads, in order of preference
+BGM_CANDIDATES = ('rescue me.mp3', 'rescue_me.mp3', 'rescue.mp3', 'Rescue Me.mp3')
+
+
+def source_signature(*paths, **params):
+    """Hash of the source files' mtimes and sizes plus the render parameters."""
+    h = hashlib.sha256()
+    for path in paths:
+        st = Path(path).stat() if Path(path).exists() else None
+        h.update(f"{path}|{st and st.st_mtime_ns}|{st and st.st_size}\n".encode('utf-8'))
+    h.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+
+def is_up_to_date(output, signature):
+    """True if output exists and its .sig sidecar matches signature (delete it to force a rebuild)."""
+    sidecar = Path(f"{output}.sig")
+    return Path(output).exists() and sidecar.exists() and sidecar.read_text() == signature
+
+
+def mark_up_to_date(output, signature):
+    """Record the signature output was built from, if it was written."""
+    if Path(output).exists():
+        Path(f"{output}.sig").write_text(signature)
+
 
 def main():
     # Input base video (rendered with Manim separately)
@@ -11,25 +38,37 @@ def main():
     json_caps = 'examples/captions_template.json'
     captions = dot.load_captions_from_json(json_caps)
 
-    # Narration only
+    # Narration only, skipped when the video and captions are unchanged
     out_narr = 'media/videos/dotmotion_pitch/480p15/DotmotionPitch_manual_narrated.mp4'
-    dot.narrate_from_captions(video_in, captions, out_narr, burn_subtitles=False)
-    print('Wrote', out_narr)
+    narr_sig = source_signature(video_in, json_caps, burn_subtitles=False)
+    if is_up_to_date(out_narr, narr_sig):
+        print('Up to date', out_narr)
+    else:
+        dot.narrate_from_captions(video_in, captions, out_narr, burn_subtitles=False)
+        mark_up_to_date(out_narr, narr_sig)
+        print('Wrote', out_narr)
 
     # Narration + BGM (ensure BGM exists)
     music = Path('assets/bgm.mp3')
     if not music.exists():
-        home = Path.home()
-        for cand in ['rescue me.mp3', 'rescue_me.mp3', 'rescue.mp3', 'Rescue Me.mp3']:
-            p = home / 'Downloads' / cand
-            if p.exists():
-                music = p
-                break
+        # One directory listing instead of a stat per candidate
+        try:
+            with os.scandir(Path.home() / 'Downloads') as entries:
+                found = {e.name: e.path for e in entries if e.name in BGM_CANDIDATES}
+        except OSError:
+            found = {}
+        music = next((Path(found[c]) for c in BGM_CANDIDATES if c in found), music)
 
     if music.exists():
         out_mix = 'media/videos/dotmotion_pitch/480p15/DotmotionPitch_manual_narrated_bgm.mp4'
-        dot.narrate_with_bgm(video_in, captions, str(music), out_mix, burn_subtitles=False, music_db=-22.0)
-        print('Wrote', out_mix)
+        mix_sig = source_signature(out_narr, music, music_db=-22.0)
+        if is_up_to_date(out_mix, mix_sig):
+            print('Up to date', out_mix)
+        else:
+            # Mix under the narrated cut so TTS and the narration mix aren't redone
+            dot.add_background_music(out_narr, str(music), out_mix, music_db=-22.0)
+            mark_up_to_date(out_mix, mix_sig)
+            print('Wrote', out_mix)
     else:
         print('No BGM found; skipped mix.')
 
@@ -1,8 +1,17 @@
 from manim import (Scene, ORIGIN, UP, DOWN, LEFT, RIGHT, FadeIn, FadeOut,
-                   Write, Create, Indicate, VGroup, config)
+                   Write, Create, Indicate, VGroup, Rectangle, config)
 import numpy as np
+import sys
 import dotmotion as dot
 
+# play()/wait() calls in OneMinutePolkadot
+ONE_MIN_ANIMATIONS = 32
+
+
+def smoothstep(t):
+    """Cubic ease-in-out used for drawing the relay ring."""
+    return t * t * (3 - 2 * t)
+
 
 class OneMinutePolkadot(Scene):
     """~60s polished overview using assets and overlap-safe text."""
@@ -20,22 +29,24 @@ class OneMinutePolkadot(Scene):
 
         # PHASE 1: Ecosystem core
         relay = dot.PolkadotRelay(radius=2.4, n_validators=8, name_position="above")
-        self.play(Create(relay.ring, run_time=1.2, rate_func=lambda t: t*t*(3-2*t)))
+        self.play(Create(relay.ring, run_time=1.2, rate_func=smoothstep))
         self.play(Write(relay.name, run_time=0.7))
         self.play(FadeIn(relay.validators, run_time=0.9, lag_ratio=0.12))
 
-        # Parachains from registry themes
-        registry = dot.load_chain_registry()
-        mythos_name, _, mythos_color = dot.get_chain_theme("mythos", registry) or ("Mythos", None, dot.ACALA_COLOR)
-        moonbeam_name, _, moonbeam_color = dot.get_chain_theme("moonbeam", registry) or ("Moonbeam", None, dot.MOONBEAM_COLOR)
-        hydration_name, _, hydration_color = dot.get_chain_theme("hydration", registry) or ("Hydration", None, dot.ASTAR_COLOR)
+        # Parachains from registry themes (cached by dotmotion), with
+        # fallbacks for chains missing from the registry
+        chain_ids = ["mythos", "moonbeam", "hydration"]
+        fallbacks = [("Mythos", None, dot.ACALA_COLOR),
+                     ("Moonbeam", None, dot.MOONBEAM_COLOR),
+                     ("Hydration", None, dot.ASTAR_COLOR)]
+        (mythos_name, _, mythos_color), (moonbeam_name, _, moonbeam_color), (hydration_name, _, hydration_color) = [
+            dot.get_chain_theme(cid) or fallback for cid, fallback in zip(chain_ids, fallbacks)]
 
         paras = [
             dot.Parachain(name=mythos_name, position=LEFT * 4.6 + UP * 1.4, color=mythos_color, radius=0.9),
             dot.Parachain(name=moonbeam_name, position=RIGHT * 4.6 + DOWN * 1.0, color=moonbeam_color, radius=0.9),
             dot.Parachain(name=hydration_name, position=RIGHT * 4.4 + UP * 1.9, color=hydration_color, radius=0.9),
         ]
-        paras_group = VGroup(*paras)
         for p in paras:
             self.play(*relay.connect_parachain(p, animate=True), run_time=1.0)
             self.play(Indicate(p, color=p.circle.get_color(), scale_factor=1.05), run_time=0.5)
@@ -47,36 +58,38 @@ class OneMinutePolkadot(Scene):
 
         # Ensure label sits fully above the ring edge and avoid logo overlap
         dot.push_above_ring(relay.name, relay.ring, buffer=0.38)
-        dot.resolve_overlap(relay.name, logo, direction=UP, step=0.1, max_steps=16)
+        dot.resolve_overlap_exact(relay.name, logo, direction=UP)
         dot.clamp_to_frame(relay.name, margin=0.2)
 
         # Ensure ring/validators render cleanly around the logo
-        try:
-            relay.ring.set_z_index(1)
-            relay.validators.set_z_index(2)
-            logo.set_z_index(3)
-            relay.name.set_z_index(4)
-        except Exception:
-            self.bring_to_front(relay.ring, relay.validators, logo, relay.name)
-
-        # Now create and place badges outside each circle along outward vector
+        relay.ring.set_z_index(1)
+        relay.validators.set_z_index(2)
+        logo.set_z_index(3)
+        relay.name.set_z_index(4)
+
+        # Now create and place badges outside each circle along outward vector,
+        # with every outward direction computed in one array operation
+        centers = np.array([p.get_center() for p in paras])
+        badge_dirs = centers / (np.linalg.norm(centers, axis=1, keepdims=True) + 1e-6)
         badges = VGroup()
-        badge_dirs = []
-        for p, cid in zip(paras, ["mythos", "moonbeam", "hydration"]):
+        for p, cid, dir_vec in zip(paras, chain_ids, badge_dirs):
             badge = dot.make_badge_from_registry(cid, layout="horizontal", max_width=1.5)
-            pc = p.get_center()
-            dir_vec = (pc / (np.linalg.norm(pc) + 1e-6))
             badge.next_to(p, dir_vec, buff=0.38)
             badge.shift(dir_vec * 0.2)
-            dot.resolve_overlap(badge, logo, direction=dir_vec, step=0.12, max_steps=20)
-            dot.resolve_overlap(badge, relay.name, direction=dir_vec, step=0.12, max_steps=20)
+            dot.resolve_overlap_exact(badge, logo, direction=dir_vec)
+            dot.resolve_overlap_exact(badge, relay.name, direction=dir_vec)
             dot.clamp_to_frame(badge, margin=0.2)
             badges.add(badge)
-            badge_dirs.append(dir_vec)
-        # Resolve inter-badge collisions
+        # Resolve inter-badge collisions. Badges whose bounding circles are
+        # apart cannot overlap, so only close pairs get the exact check
+        badge_centers = np.array([b.get_center() for b in badges])
+        badge_radii = np.array([np.hypot(b.width, b.height) / 2 for b in badges])
         for i in range(len(badges)):
             for j in range(i + 1, len(badges)):
-                dot.resolve_overlap(badges[j], badges[i], direction=badge_dirs[j], step=0.12, max_steps=20)
+                if np.linalg.norm(badge_centers[j] - badge_centers[i]) > badge_radii[i] + badge_radii[j]:
+                    continue
+                dot.resolve_overlap_exact(badges[j], badges[i], direction=badge_dirs[j])
+                badge_centers[j] = badges[j].get_center()
         self.play(FadeIn(badges, run_time=0.6, lag_ratio=0.15))
 
         # Non-overlapping explanatory text
@@ -90,12 +103,13 @@ class OneMinutePolkadot(Scene):
                                 wait_time=1.2)
 
         # PHASE 2: XCM example with background dimming for focus
-        dim = dot.RoundedRectangle(width=config.frame_width * 1.1,
-                                   height=config.frame_height * 1.1,
-                                   corner_radius=0.1,
-                                   fill_opacity=0.65,
-                                   stroke_opacity=0,
-                                   color=dot.BLACK)
+        # Plain rectangle: its corners are off-frame, so rounding them only
+        # adds curve segments to every dimmed frame
+        dim = Rectangle(width=config.frame_width * 1.1,
+                        height=config.frame_height * 1.1,
+                        fill_opacity=0.65,
+                        stroke_opacity=0,
+                        color=dot.BLACK)
         self.play(FadeIn(dim, run_time=0.4))
         xcm = dot.animate_xcm(self, paras[0], paras[1], xcm_type="transfer", message="XCM: Transfer", duration=1.8)
         self.play(FadeOut(xcm, run_time=0.3))
@@ -110,12 +124,8 @@ class OneMinutePolkadot(Scene):
                                 margin=0.4,
                                 wait_time=1.2)
 
-        # PHASE 4: Transition — clear all elements and end
-        if hasattr(relay, "connection_lines") and relay.connection_lines:
-            self.play(*[FadeOut(l, run_time=0.3) for l in relay.connection_lines])
-        self.play(FadeOut(logo), FadeOut(paras_group), FadeOut(badges), FadeOut(relay), run_time=0.7)
-
-        # PHASE 5: Ending — fully clear the scene before final card
+        # PHASE 4: Transition — fade out everything on screen (relay, connection
+        # lines, logo, parachains, badges) in one play before the final card
         if self.mobjects:
             self.play(*[FadeOut(m) for m in list(self.mobjects)], run_time=0.7)
 
@@ -127,6 +137,12 @@ class OneMinutePolkadot(Scene):
 
 
 if __name__ == "__main__":
-    print("Run: manim -pqm examples/one_min_demo.py OneMinutePolkadot")
+    if "--parallel" in sys.argv:
+        out = dot.render_parallel(__file__, "OneMinutePolkadot", ONE_MIN_ANIMATIONS,
+                                  "OneMinutePolkadot.mp4")
+        print(f"Rendered {out}")
+    else:
+        print("Run: manim -pqm examples/one_min_demo.py OneMinutePolkadot")
+        print("To render in parallel processes: python examples/one_min_demo.py --parallel")
 
 
@@ -1,5 +1,9 @@
+from pathlib import Path
+
 from setuptools import setup
 
+README = Path(__file__).with_name("README.md")
+
 setup(
     name="dotmotion",
     version="0.1.0",
@@ -7,7 +11,8 @@ setup(
     author_email="info@montaqlabs.com",
     description=(
         "Animation toolkit for creating Polkadot ecosystem visualizations"),
-    long_description=open("README.md").read(),
+    long_description=(
+        README.read_text(encoding="utf-8") if README.exists() else ""),
     long_description_content_type="text/markdown",
     url="https://github.com/MontaQLabs/DotMotion",
     py_modules=["dotmotion"],
@@ -16,7 +21,7 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[
         "manim>=0.17.0",
         "numpy>=1.20.0",